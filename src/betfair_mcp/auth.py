@@ -5,17 +5,23 @@ This module provides thread-safe session management for the Betfair API,
 handling login, logout, and session keep-alive automatically.
 """
 
+import functools
 import logging
 import os
-from threading import Lock
-from typing import Optional
+import stat
+from threading import Event, Lock
+from typing import Any, Optional
 
 import betfairlightweight
+import httpx
 from betfairlightweight import APIClient
 from betfairlightweight.exceptions import BetfairError
 
 logger = logging.getLogger(__name__)
 
+# Matches betfairlightweight's default (connect, read) timeouts
+IDENTITY_TIMEOUT = (3.05, 16.0)
+
 
 class BetfairSessionManager:
     """
@@ -49,9 +55,13 @@ class BetfairSessionManager:
         self.cert_file = cert_file
         self.key_file = key_file
 
-        # Thread safety
-        self.lock = Lock()
-        self.session_active = False
+        # Thread safety: the Event carries session state and is safe to read
+        # without locking; the lock only serialises login/logout transitions
+        self._active = Event()
+        self._login_lock = Lock()
+
+        # Shared async HTTP client for keep-alive/logout, created on first use
+        self._http: Optional[httpx.AsyncClient] = None
 
         # Initialize API client
         self.client: Optional[APIClient] = None
@@ -61,17 +71,24 @@ class BetfairSessionManager:
         """Initialize the betfairlightweight API client."""
         # Check if certificate authentication should be used
         if self.cert_file and self.key_file:
-            if os.path.exists(self.cert_file) and os.path.exists(self.key_file):
-                # SECURITY: Verify private key file permissions (P1-1 fix)
+            # One stat per file covers both existence and permission checks
+            # (no exists()/stat() TOCTOU gap)
+            try:
+                os.stat(self.cert_file)
                 key_stat = os.stat(self.key_file)
-                key_perms = oct(key_stat.st_mode)[-3:]
-                if key_perms != '600':
+            except FileNotFoundError:
+                key_stat = None
+
+            if key_stat is not None:
+                # SECURITY: Verify private key file permissions (P1-1 fix)
+                key_perms = stat.S_IMODE(key_stat.st_mode) & 0o777
+                if key_perms != 0o600:
                     raise RuntimeError(
                         f"SECURITY ERROR: Private key file {self.key_file} has "
-                        f"incorrect permissions {key_perms} (should be 600). "
+                        f"incorrect permissions {key_perms:o} (should be 600). "
                         f"Fix with: chmod 600 {self.key_file}"
                     )
-                logger.info(f"Private key permissions verified: {key_perms}")
+                logger.info(f"Private key permissions verified: {key_perms:o}")
                 
                 certs_path = os.path.dirname(self.cert_file)  # betfairlightweight expects directory path
                 logger.info(f"Certificate authentication enabled: {certs_path}")
@@ -107,14 +124,29 @@ class BetfairSessionManager:
         Ensure the session is active, logging in if necessary.
 
         This method is thread-safe and can be called before any API operation.
+        The common case (session already active) is a lock-free read; the lock
+        is only taken when a login may actually be needed.
 
         Raises:
             BetfairError: If login fails
         """
-        with self.lock:
-            if not self.session_active:
+        if self._active.is_set():
+            return
+
+        with self._login_lock:
+            # Re-check: another thread may have logged in while we waited
+            if not self._active.is_set():
                 self._login()
 
+    def is_logged_in_fast(self) -> bool:
+        """
+        Lock-free check for an active session.
+
+        Lets async callers skip dispatching ensure_logged_in to a worker
+        thread when no login is needed.
+        """
+        return self._active.is_set()
+
     def _login(self) -> None:
         """
         Internal login method (must be called with lock held).
@@ -125,11 +157,11 @@ class BetfairSessionManager:
         try:
             logger.info(f"Logging in to Betfair as {self.username}")
             self.client.login()
-            self.session_active = True
+            self._active.set()
             logger.info("Successfully logged in to Betfair")
         except BetfairError as e:
             logger.error(f"Betfair login failed: {e}")
-            self.session_active = False
+            self._active.clear()
             raise
 
     def keep_alive(self) -> bool:
@@ -142,20 +174,21 @@ class BetfairSessionManager:
         Returns:
             bool: True if keep-alive successful, False otherwise
         """
-        with self.lock:
-            if not self.session_active:
-                logger.warning("Cannot send keep-alive: session not active")
-                return False
+        # The HTTPS round-trip runs unlocked so concurrent callers are not
+        # serialised behind it.
+        if not self._active.is_set():
+            logger.warning("Cannot send keep-alive: session not active")
+            return False
 
-            try:
-                logger.debug("Sending session keep-alive")
-                self.client.keep_alive()
-                logger.debug("Keep-alive successful")
-                return True
-            except BetfairError as e:
-                logger.error(f"Keep-alive failed: {e}")
-                self.session_active = False
-                return False
+        try:
+            logger.debug("Sending session keep-alive")
+            self.client.keep_alive()
+            logger.debug("Keep-alive successful")
+            return True
+        except BetfairError as e:
+            logger.error(f"Keep-alive failed: {e}")
+            self._active.clear()
+            return False
 
     def logout(self) -> None:
         """
@@ -163,16 +196,99 @@ class BetfairSessionManager:
 
         This should be called when shutting down the server.
         """
-        with self.lock:
-            if self.session_active:
-                try:
-                    logger.info("Logging out from Betfair")
-                    self.client.logout()
-                    self.session_active = False
+        if not self._active.is_set():
+            return
+
+        try:
+            logger.info("Logging out from Betfair")
+            self.client.logout()
+            logger.info("Successfully logged out")
+        except BetfairError as e:
+            logger.error(f"Logout failed: {e}")
+        finally:
+            self._active.clear()
+
+    async def _identity_post(self, endpoint: str) -> dict[str, Any]:
+        """
+        POST to a Betfair identity endpoint (keepAlive/logout) natively async.
+
+        Uses the same URL and headers betfairlightweight would, so the
+        session token stays in sync with the sync client.
+
+        Raises:
+            httpx.HTTPError: If the request fails
+            ValueError: If the response body is not a JSON object
+        """
+        client = self.get_client()
+        if self._http is None:
+            connect, read = IDENTITY_TIMEOUT
+            self._http = httpx.AsyncClient(timeout=httpx.Timeout(read, connect=connect))
+        response = await self._http.post(
+            client.identity_uri + endpoint,
+            headers=client.keep_alive_headers,
+        )
+        response.raise_for_status()
+        payload = response.json()
+        if not isinstance(payload, dict):
+            raise ValueError(f"Unexpected {endpoint} response: {payload!r}")
+        return payload
+
+    async def keep_alive_async(self) -> bool:
+        """
+        Async variant of keep_alive() that avoids a thread-pool hop.
+
+        Returns:
+            bool: True if keep-alive successful, False otherwise
+        """
+        if not self._active.is_set():
+            logger.warning("Cannot send keep-alive: session not active")
+            return False
+
+        try:
+            logger.debug("Sending session keep-alive")
+            response = await self._identity_post("keepAlive")
+        except (httpx.HTTPError, ValueError) as e:
+            logger.error(f"Keep-alive failed: {e}")
+            self._active.clear()
+            return False
+
+        if response.get("status") != "SUCCESS":
+            logger.error(f"Keep-alive failed: {response.get('error')}")
+            self._active.clear()
+            return False
+
+        self.get_client().set_session_token(response["token"])
+        logger.debug("Keep-alive successful")
+        return True
+
+    async def logout_async(self) -> None:
+        """
+        Async variant of logout() that avoids a thread-pool hop.
+
+        Also closes the shared async HTTP client.
+        """
+        try:
+            if not self._active.is_set():
+                return
+
+            try:
+                logger.info("Logging out from Betfair")
+                response = await self._identity_post("logout")
+                if response.get("status") == "SUCCESS":
                     logger.info("Successfully logged out")
-                except BetfairError as e:
-                    logger.error(f"Logout failed: {e}")
-                    self.session_active = False
+                else:
+                    logger.error(f"Logout failed: {response.get('error')}")
+            except (httpx.HTTPError, ValueError) as e:
+                logger.error(f"Logout failed: {e}")
+            finally:
+                self.get_client().client_logout()
+                self._active.clear()
+        finally:
+            # Close the client on every path, including an inactive session
+            # and unexpected exceptions
+            if self._http is not None:
+                await self._http.aclose()
+                self._http = None
 
     def get_client(self) -> APIClient:
         """
@@ -191,14 +307,18 @@ class BetfairSessionManager:
     @property
     def is_active(self) -> bool:
         """Check if the session is currently active."""
-        with self.lock:
-            return self.session_active
+        return self._active.is_set()
 
 
+@functools.cache
 def create_session_manager_from_env() -> BetfairSessionManager:
     """
     Create a BetfairSessionManager from environment variables.
 
+    The manager is built once and reused by subsequent calls. If the
+    environment changes (e.g. in tests), call
+    ``create_session_manager_from_env.cache_clear()`` to rebuild it.
+
     Required environment variables:
         - BETFAIR_USERNAME
         - BETFAIR_PASSWORD
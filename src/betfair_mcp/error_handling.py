@@ -9,7 +9,9 @@ for common Betfair API errors, including:
 """
 
 import asyncio
+import functools
 import logging
+import re
 from typing import Any, Callable, TypeVar
 
 from betfairlightweight.exceptions import BetfairError
@@ -27,6 +29,9 @@ logger = logging.getLogger(__name__)
 # Type variable for generic return types
 T = TypeVar('T')
 
+# A tenacity retry decorator: wraps a callable in the same call signature
+RetryDecorator = Callable[[Callable[..., Any]], Callable[..., Any]]
+
 
 class BetfairAPIError(Exception):
     """Base exception for Betfair API errors."""
@@ -53,6 +58,23 @@ class ThrottledError(BetfairAPIError):
     pass
 
 
+# Single-pass scan for every error token we classify on
+_ERROR_PATTERN = re.compile(
+    r"INVALID_SESSION_TOKEN|SESSION|TOO_MANY_REQUESTS|TOO_MUCH_DATA|THROTTLED|TEMPORARY_BAN",
+    re.IGNORECASE,
+)
+
+# Token -> (exception class, message prefix), in classification priority order
+_ERROR_MAP = {
+    "INVALID_SESSION_TOKEN": (SessionExpiredError, "Session expired or invalid"),
+    "SESSION": (SessionExpiredError, "Session expired or invalid"),
+    "TOO_MANY_REQUESTS": (RateLimitError, "Rate limit exceeded"),
+    "TOO_MUCH_DATA": (DataLimitError, "Request contains too much data"),
+    "THROTTLED": (ThrottledError, "Temporarily throttled or banned"),
+    "TEMPORARY_BAN": (ThrottledError, "Temporarily throttled or banned"),
+}
+
+
 def classify_betfair_error(error: BetfairError) -> Exception:
     """Classify a Betfair error into specific exception types.
 
@@ -62,19 +84,13 @@ def classify_betfair_error(error: BetfairError) -> Exception:
     Returns:
         A more specific exception type based on the error message
     """
-    error_msg = str(error).upper()
-
-    if "INVALID_SESSION_TOKEN" in error_msg or "SESSION" in error_msg:
-        return SessionExpiredError(f"Session expired or invalid: {error}")
+    found = {token.upper() for token in _ERROR_PATTERN.findall(str(error))}
 
-    if "TOO_MANY_REQUESTS" in error_msg:
-        return RateLimitError(f"Rate limit exceeded: {error}")
-
-    if "TOO_MUCH_DATA" in error_msg:
-        return DataLimitError(f"Request contains too much data: {error}")
-
-    if "THROTTLED" in error_msg or "TEMPORARY_BAN" in error_msg:
-        return ThrottledError(f"Temporarily throttled or banned: {error}")
+    if found:
+        # Honour priority order when a message mentions several tokens
+        for token, (error_cls, prefix) in _ERROR_MAP.items():
+            if token in found:
+                return error_cls(f"{prefix}: {error}")
 
     # Return original error if not classified
     return error
@@ -105,11 +121,13 @@ async def retry_with_session_refresh(
     """
     max_attempts = 2  # Try once, then retry after refresh
 
+    # Ensure session is active (the refresh branch below re-logs in itself);
+    # only cross into the thread pool when a login is actually needed
+    if not session_manager.is_logged_in_fast():
+        await asyncio.to_thread(session_manager.ensure_logged_in)
+
     for attempt in range(max_attempts):
         try:
-            # Ensure session is active
-            await asyncio.to_thread(session_manager.ensure_logged_in)
-
             # Execute the operation
             return await operation(*args, **kwargs)
 
@@ -141,7 +159,7 @@ def create_retry_decorator(
     max_attempts: int = 3,
     min_wait: int = 1,
     max_wait: int = 10,
-):
+) -> RetryDecorator:
     """Create a retry decorator for Betfair API operations.
 
     This decorator handles transient errors with exponential backoff,
@@ -164,6 +182,16 @@ def create_retry_decorator(
     )
 
 
+@functools.lru_cache(maxsize=8)
+def _cached_retry(max_attempts: int, min_wait: int = 1, max_wait: int = 10) -> RetryDecorator:
+    """Return a shared retry decorator for the given settings.
+
+    Tenacity keeps per-call state in its own attempt objects, so a single
+    decorator instance can safely be reused across calls.
+    """
+    return create_retry_decorator(max_attempts, min_wait, max_wait)
+
+
 async def execute_with_retry(
     operation: Callable[..., T],
     *args: Any,
@@ -186,7 +214,7 @@ async def execute_with_retry(
     Raises:
         BetfairAPIError: If the operation fails after all retries
     """
-    retry_decorator = create_retry_decorator(max_attempts=max_attempts)
+    retry_decorator = _cached_retry(max_attempts)
 
     async def wrapped_operation():
         try:
@@ -215,30 +243,3 @@ def log_api_error(error: Exception, operation: str, context: dict = None) -> Non
     logger.error(
         f"Betfair API error in {operation}: {type(error).__name__}: {error}{context_str}"
     )
-
-
-async def handle_data_limit_error(
-    market_ids: list[str],
-    max_markets_per_request: int = 50
-) -> list[list[str]]:
-    """Split a large market ID list into smaller chunks to avoid TOO_MUCH_DATA.
-
-    Args:
-        market_ids: List of market IDs
-        max_markets_per_request: Maximum markets per request chunk
-
-    Returns:
-        List of market ID chunks
-    """
-    chunks = []
-    for i in range(0, len(market_ids), max_markets_per_request):
-        chunk = market_ids[i:i + max_markets_per_request]
-        chunks.append(chunk)
-
-    if len(chunks) > 1:
-        logger.warning(
-            f"Split {len(market_ids)} markets into {len(chunks)} chunks "
-            f"to avoid data limit errors"
-        )
-
-    return chunks
@@ -3,19 +3,159 @@ Response formatting utilities for MCP tools.
 
 This module provides utilities to format tool responses in both
 Markdown (human-friendly) and JSON (machine-readable) formats.
+The JSON path serialises the already dict-shaped tool data with orjson
+and skips Markdown generation entirely.
 
 All formatters enforce character limits to prevent excessively large responses.
 """
 
-from typing import Any, Dict, List
+import functools
+import hashlib
+import io
+from collections import OrderedDict
+from heapq import nlargest, nsmallest
+from operator import itemgetter
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+import orjson
 
 # Character limits for summary fields (prevent huge context usage)
 MAX_SUMMARY_LENGTH = 4000  # Maximum characters for summary field
 MAX_TABLE_ROWS = 50  # Maximum rows in tables before truncation
 MAX_LIST_ITEMS = 20  # Maximum items in lists before truncation
+SUMMARY_CACHE_SIZE = 256  # Rendered summaries kept per formatter
+
+
+class Summary(NamedTuple):
+    """Rendered summary text and whether it was cut short."""
+
+    text: str
+    truncated: bool
+
+
+# Account templates, parsed once at import and filled via format_map
+_BALANCE_TPL = """## Account Balance
+
+**Available to Bet:** £{available_to_bet:.2f}
+**Current Exposure:** £{exposure:.2f}
+**Exposure Limit:** £{exposure_limit:.2f}
+**Wallet:** {wallet}
+**Discount Rate:** {discount_rate:.1%}
+""".format_map
+_DETAILS_TPL = """## Account Details
+
+**Name:** {first_name} {last_name}
+**Currency:** {currency_code}
+**Timezone:** {timezone}
+**Locale:** {locale_code}
+**Betfair Points:** {points_balance:,}
+**Discount Rate:** {discount_rate:.1%}
+""".format_map
+
+# Row templates, parsed once at import instead of per row
+_EVENT_BLOCK = (
+    "**{name}**\n"
+    "- Event ID: `{event_id}`\n"
+    "- Start: {start}\n"
+    "- Country: {country}\n"
+    "- Markets: {markets}\n"
+    "\n"
+).format
+_MARKET_BLOCK = "**{name}** ({market_type})\n- Market ID: `{market_id}`\n- Event: {event}\n".format
+_RUNNER_LINE = "  - {name} (ID: {selection_id})\n".format
+_EVENT_TYPE_ROW = "| {id} | {name} | {markets:,} |\n".format
+_COMPETITION_ROW = "| {id} | {name} | {markets:,} |\n".format
+_PRICES_MARKET_HEADER = "**Market {market_id}** ({status})\n- Total Matched: {matched}\n\n".format
+_PRICE_TABLE_HEADER = "| Runner | Last Price | Back | Lay |\n|---|---:|---|---|\n"
+_PRICE_ROW = "| {sel} | {last} | {back} | {lay} |\n".format
+
+# Competitions are ranked by market count in both summary formats
+_BY_MARKET_COUNT = itemgetter("market_count")
+
+# Bound value formatters for per-row numbers
+_PRICE_FMT = "{:.2f}".format
+_SIZE_FMT = "{:.2f} (£{:.0f})".format
+_CURRENCY_FMT = "£{:,.2f}".format
+
+# Shared default for missing lists (avoids allocating a fresh [] per lookup)
+_EMPTY = ()
+
+_TRUNCATION_NOTE = "\n*...truncated*"
+
+
+class _SummaryBuffer:
+    """
+    Write buffer that flags when MAX_SUMMARY_LENGTH has been reached.
+
+    Formatters check ``full`` inside their loops and stop generating
+    Markdown that would only be cut off, bounding work to the output size.
+    """
+
+    __slots__ = ("_buf", "_length", "full")
+
+    def __init__(self) -> None:
+        self._buf = io.StringIO()
+        self._length = 0
+        self.full = False
+
+    def write(self, text: str) -> None:
+        self._buf.write(text)
+        self._length += len(text)
+        if self._length >= MAX_SUMMARY_LENGTH:
+            self.full = True
+
+    def summary(self) -> Summary:
+        text = self._buf.getvalue()
+        if self.full:
+            text = text[:MAX_SUMMARY_LENGTH - len(_TRUNCATION_NOTE)] + _TRUNCATION_NOTE
+        return Summary(text, self.full)
+
+
+_ListFormatter = Callable[[List[Dict[str, Any]]], Summary]
+
+
+def _memoize_summary(
+    key_items: Optional[int] = None,
+) -> Callable[[_ListFormatter], _ListFormatter]:
+    """
+    Cache a list formatter's output keyed by a digest of its input.
+
+    Polling clients often request identical data back to back; on a hit the
+    Markdown is returned without being rebuilt. The key is a 16-byte
+    BLAKE2b digest of the orjson encoding plus the item count, so the
+    bounded LRU only holds rendered summaries, not copies of the input.
+
+    Args:
+        key_items: Number of leading items that determine the output (the
+            formatter's display slice); None hashes the whole list. Keeping
+            this to the display slice keeps hashing cheaper than rendering.
+    """
+
+    def decorator(formatter: _ListFormatter) -> _ListFormatter:
+        cache: OrderedDict[tuple[bytes, int], Summary] = OrderedDict()
 
+        @functools.wraps(formatter)
+        def wrapper(data: List[Dict[str, Any]]) -> Summary:
+            keyed = data if key_items is None else data[:key_items]
+            key = (hashlib.blake2b(orjson.dumps(keyed), digest_size=16).digest(), len(data))
+            summary = cache.get(key)
+            if summary is not None:
+                cache.move_to_end(key)
+                return summary
 
-def format_account_balance(data: Dict[str, Any]) -> str:
+            summary = formatter(data)
+            cache[key] = summary
+            if len(cache) > SUMMARY_CACHE_SIZE:
+                cache.popitem(last=False)
+            return summary
+
+        wrapper.cache_clear = cache.clear  # type: ignore[attr-defined]
+        return wrapper
+
+    return decorator
+
+
+def format_account_balance(data: Dict[str, Any]) -> Summary:
     """
     Format account balance data as Markdown.
 
@@ -23,19 +163,12 @@ def format_account_balance(data: Dict[str, Any]) -> str:
         data: Account balance dict from get_account_balance
 
     Returns:
-        Markdown-formatted summary
+        Summary with Markdown text (never truncated)
     """
-    return f"""## Account Balance
-
-**Available to Bet:** £{data['available_to_bet']:.2f}
-**Current Exposure:** £{data['exposure']:.2f}
-**Exposure Limit:** £{data['exposure_limit']:.2f}
-**Wallet:** {data['wallet']}
-**Discount Rate:** {data['discount_rate']:.1%}
-"""
+    return Summary(_BALANCE_TPL(data), False)
 
 
-def format_account_details(data: Dict[str, Any]) -> str:
+def format_account_details(data: Dict[str, Any]) -> Summary:
     """
     Format account details as Markdown.
 
@@ -43,20 +176,26 @@ def format_account_details(data: Dict[str, Any]) -> str:
         data: Account details dict from get_account_details
 
     Returns:
-        Markdown-formatted summary
+        Summary with Markdown text (never truncated)
     """
-    return f"""## Account Details
-
-**Name:** {data['first_name']} {data['last_name']}
-**Currency:** {data['currency_code']}
-**Timezone:** {data['timezone']}
-**Locale:** {data['locale_code']}
-**Betfair Points:** {data['points_balance']:,}
-**Discount Rate:** {data['discount_rate']:.1%}
-"""
+    return Summary(_DETAILS_TPL(data), False)
+
+
+def format_account_snapshot(data: Dict[str, Any]) -> Summary:
+    """
+    Format an account snapshot (balance plus details) as Markdown.
+
+    Args:
+        data: Snapshot dict from get_account_snapshot
+
+    Returns:
+        Summary with Markdown text (never truncated)
+    """
+    return Summary(_BALANCE_TPL(data["balance"]) + "\n" + _DETAILS_TPL(data["details"]), False)
 
 
-def format_event_types(data: List[Dict[str, Any]]) -> str:
+@_memoize_summary()
+def format_event_types(data: List[Dict[str, Any]]) -> Summary:
     """
     Format event types list as Markdown.
 
@@ -64,30 +203,37 @@ def format_event_types(data: List[Dict[str, Any]]) -> str:
         data: List of event types from list_event_types
 
     Returns:
-        Markdown-formatted table (truncated if > MAX_TABLE_ROWS)
+        Summary with a Markdown table (rows limited to MAX_TABLE_ROWS)
     """
     if not data:
-        return "## Event Types\\n\\nNo event types found."
+        return Summary("## Event Types\n\nNo event types found.", False)
 
     total = len(data)
-    sorted_data = sorted(data, key=lambda x: x["event_type_name"])
-    display_data = sorted_data[:MAX_TABLE_ROWS]
+    # Only the first MAX_TABLE_ROWS are shown, so avoid a full sort
+    display_data = nsmallest(MAX_TABLE_ROWS, data, key=itemgetter("event_type_name"))
 
-    lines = [f"## Event Types ({total} total)", "", "| ID | Sport | Markets |", "|---|---|---:|"]
+    buf = _SummaryBuffer()
+    buf.write(f"## Event Types ({total} total)\n\n| ID | Sport | Markets |\n|---|---|---:|\n")
     for et in display_data:
-        lines.append(
-            f"| {et['event_type_id']} | {et['event_type_name']} | {et['market_count']:,} |"
+        buf.write(_EVENT_TYPE_ROW(
+            id=et["event_type_id"],
+            name=et["event_type_name"],
+            markets=et["market_count"],
+        ))
+        if buf.full:
+            break
+
+    if total > MAX_TABLE_ROWS and not buf.full:
+        buf.write(
+            f"\n*Showing {MAX_TABLE_ROWS} of {total} event types "
+            "(use data field for full list)*"
         )
 
-    if total > MAX_TABLE_ROWS:
-        lines.append("")
-        lines.append(f"*Showing {MAX_TABLE_ROWS} of {total} event types (use data field for full list)*")
+    return buf.summary()
 
-    result = "\\n".join(lines)
-    return result[:MAX_SUMMARY_LENGTH]
 
-
-def format_events(data: List[Dict[str, Any]]) -> str:
+@_memoize_summary(key_items=MAX_LIST_ITEMS)
+def format_events(data: List[Dict[str, Any]]) -> Summary:
     """
     Format events list as Markdown.
 
@@ -95,32 +241,34 @@ def format_events(data: List[Dict[str, Any]]) -> str:
         data: List of events from list_events
 
     Returns:
-        Markdown-formatted summary (truncated if > MAX_LIST_ITEMS)
+        Summary with Markdown text (items limited to MAX_LIST_ITEMS)
     """
     if not data:
-        return "## Events\\n\\nNo events found."
+        return Summary("## Events\n\nNo events found.", False)
 
     total = len(data)
     display_data = data[:MAX_LIST_ITEMS]
 
-    lines = [f"## Events ({total} found)", ""]
+    buf = _SummaryBuffer()
+    buf.write(f"## Events ({total} found)\n\n")
     for event in display_data:
-        date = event.get("open_date", "Unknown")
-        lines.append(f"**{event['event_name']}**")
-        lines.append(f"- Event ID: `{event['event_id']}`")
-        lines.append(f"- Start: {date}")
-        lines.append(f"- Country: {event.get('country_code', 'N/A')}")
-        lines.append(f"- Markets: {event['market_count']}")
-        lines.append("")
+        buf.write(_EVENT_BLOCK(
+            name=event["event_name"],
+            event_id=event["event_id"],
+            start=event.get("open_date", "Unknown"),
+            country=event.get("country_code", "N/A"),
+            markets=event["market_count"],
+        ))
+        if buf.full:
+            break
 
-    if total > MAX_LIST_ITEMS:
-        lines.append(f"*Showing {MAX_LIST_ITEMS} of {total} events (use data field for full list)*")
+    if total > MAX_LIST_ITEMS and not buf.full:
+        buf.write(f"*Showing {MAX_LIST_ITEMS} of {total} events (use data field for full list)*")
 
-    result = "\\n".join(lines)
-    return result[:MAX_SUMMARY_LENGTH]
+    return buf.summary()
 
 
-def format_competitions(data: List[Dict[str, Any]]) -> str:
+def format_competitions(data: List[Dict[str, Any]]) -> Summary:
     """
     Format competitions list as Markdown.
 
@@ -128,35 +276,38 @@ def format_competitions(data: List[Dict[str, Any]]) -> str:
         data: List of competitions from list_competitions
 
     Returns:
-        Markdown-formatted table (truncated if > MAX_TABLE_ROWS)
+        Summary with a Markdown table (rows limited to MAX_TABLE_ROWS)
     """
     if not data:
-        return "## Competitions\\n\\nNo competitions found."
+        return Summary("## Competitions\n\nNo competitions found.", False)
 
     total = len(data)
-    sorted_data = sorted(data, key=lambda x: -x["market_count"])
-    display_data = sorted_data[:MAX_TABLE_ROWS]
-
-    lines = [
-        f"## Competitions ({total} found)",
-        "",
-        "| ID | Competition | Markets |",
-        "|---|---|---:|",
-    ]
+    display_data = nlargest(MAX_TABLE_ROWS, data, key=_BY_MARKET_COUNT)
+
+    buf = _SummaryBuffer()
+    buf.write(
+        f"## Competitions ({total} found)\n\n| ID | Competition | Markets |\n|---|---|---:|\n"
+    )
     for comp in display_data:
-        lines.append(
-            f"| {comp['competition_id']} | {comp['competition_name']} | {comp['market_count']:,} |"
+        buf.write(_COMPETITION_ROW(
+            id=comp["competition_id"],
+            name=comp["competition_name"],
+            markets=comp["market_count"],
+        ))
+        if buf.full:
+            break
+
+    if total > MAX_TABLE_ROWS and not buf.full:
+        buf.write(
+            f"\n*Showing top {MAX_TABLE_ROWS} of {total} competitions by market count "
+            "(use data field for full list)*"
         )
 
-    if total > MAX_TABLE_ROWS:
-        lines.append("")
-        lines.append(f"*Showing top {MAX_TABLE_ROWS} of {total} competitions by market count (use data field for full list)*")
-
-    result = "\\n".join(lines)
-    return result[:MAX_SUMMARY_LENGTH]
+    return buf.summary()
 
 
-def format_market_catalogue(data: List[Dict[str, Any]]) -> str:
+@_memoize_summary(key_items=MAX_LIST_ITEMS)
+def format_market_catalogue(data: List[Dict[str, Any]]) -> Summary:
     """
     Format market catalogue as Markdown.
 
@@ -164,40 +315,48 @@ def format_market_catalogue(data: List[Dict[str, Any]]) -> str:
         data: List of markets from list_market_catalogue
 
     Returns:
-        Markdown-formatted summary (truncated if > MAX_LIST_ITEMS)
+        Summary with Markdown text (items limited to MAX_LIST_ITEMS)
     """
     if not data:
-        return "## Markets\\n\\nNo markets found."
+        return Summary("## Markets\n\nNo markets found.", False)
 
     total = len(data)
     display_data = data[:MAX_LIST_ITEMS]
 
-    lines = [f"## Markets ({total} found)", ""]
+    buf = _SummaryBuffer()
+    buf.write(f"## Markets ({total} found)\n\n")
     for market in display_data:
-        lines.append(f"**{market['market_name']}** ({market['market_type']})")
-        lines.append(f"- Market ID: `{market['market_id']}`")
-        lines.append(f"- Event: {market.get('event_name', 'N/A')}")
+        buf.write(_MARKET_BLOCK(
+            name=market["market_name"],
+            market_type=market["market_type"],
+            market_id=market["market_id"],
+            event=market.get("event_name", "N/A"),
+        ))
         if market.get("competition_name"):
-            lines.append(f"- Competition: {market['competition_name']}")
-        lines.append(f"- Total Matched: £{market.get('total_matched', 0):,.2f}")
+            buf.write(f"- Competition: {market['competition_name']}\n")
+        buf.write("- Total Matched: " + _CURRENCY_FMT(market.get("total_matched", 0)) + "\n")
 
-        runners = market.get("runners", [])
+        runners = market.get("runners") or _EMPTY
         if runners:
-            lines.append(f"- Runners ({len(runners)}):")
+            buf.write(f"- Runners ({len(runners)}):\n")
             for runner in runners[:5]:  # Show first 5 runners
-                lines.append(f"  - {runner['runner_name']} (ID: {runner['selection_id']})")
+                buf.write(_RUNNER_LINE(
+                    name=runner["runner_name"], selection_id=runner["selection_id"]
+                ))
             if len(runners) > 5:
-                lines.append(f"  - *...and {len(runners) - 5} more*")
-        lines.append("")
+                buf.write(f"  - *...and {len(runners) - 5} more*\n")
+        buf.write("\n")
+        if buf.full:
+            break
 
-    if total > MAX_LIST_ITEMS:
-        lines.append(f"*Showing {MAX_LIST_ITEMS} of {total} markets (use data field for full list)*")
+    if total > MAX_LIST_ITEMS and not buf.full:
+        buf.write(f"*Showing {MAX_LIST_ITEMS} of {total} markets (use data field for full list)*")
 
-    result = "\\n".join(lines)
-    return result[:MAX_SUMMARY_LENGTH]
+    return buf.summary()
 
 
-def format_market_prices(data: List[Dict[str, Any]]) -> str:
+@_memoize_summary(key_items=MAX_LIST_ITEMS)
+def format_market_prices(data: List[Dict[str, Any]]) -> Summary:
     """
     Format market prices as Markdown.
 
@@ -205,52 +364,115 @@ def format_market_prices(data: List[Dict[str, Any]]) -> str:
         data: List of market prices from get_market_prices
 
     Returns:
-        Markdown-formatted summary with odds (truncated if > MAX_LIST_ITEMS)
+        Summary with Markdown odds tables (items limited to MAX_LIST_ITEMS)
     """
     if not data:
-        return "## Market Prices\\n\\nNo market data found."
+        return Summary("## Market Prices\n\nNo market data found.", False)
 
     total = len(data)
     display_data = data[:MAX_LIST_ITEMS]
 
-    lines = [f"## Market Prices ({total} markets)", ""]
+    buf = _SummaryBuffer()
+    buf.write(f"## Market Prices ({total} markets)\n\n")
     for market in display_data:
-        status = market.get("status", "UNKNOWN")
-        matched = market.get("total_matched", 0)
-        lines.append(f"**Market {market['market_id']}** ({status})")
-        lines.append(f"- Total Matched: £{matched:,.2f}")
-        lines.append("")
+        buf.write(_PRICES_MARKET_HEADER(
+            market_id=market["market_id"],
+            status=market.get("status", "UNKNOWN"),
+            matched=_CURRENCY_FMT(market.get("total_matched", 0)),
+        ))
 
-        runners = market.get("runners", [])
+        runners = market.get("runners") or _EMPTY
         if runners:
-            lines.append("| Runner | Last Price | Back | Lay |")
-            lines.append("|---|---:|---|---|")
+            buf.write(_PRICE_TABLE_HEADER)
             # Limit runners to prevent huge tables
             for runner in runners[:20]:
-                sel_id = runner.get("selection_id", "?")
-                last = runner.get("last_price_traded")
-                last_str = f"{last:.2f}" if last else "—"
-
-                backs = runner.get("back_prices", [])
-                back_str = (
-                    f"{backs[0]['price']:.2f} (£{backs[0]['size']:.0f})"
-                    if backs
-                    else "—"
-                )
-
-                lays = runner.get("lay_prices", [])
-                lay_str = (
-                    f"{lays[0]['price']:.2f} (£{lays[0]['size']:.0f})" if lays else "—"
-                )
+                get = runner.get
+                sel_id = get("selection_id", "?")
+                last = get("last_price_traded")
+                backs = get("back_prices") or _EMPTY
+                lays = get("lay_prices") or _EMPTY
+
+                last_str = _PRICE_FMT(last) if last else "—"
+
+                if backs:
+                    best = backs[0]
+                    back_str = _SIZE_FMT(best["price"], best["size"])
+                else:
+                    back_str = "—"
+
+                if lays:
+                    best = lays[0]
+                    lay_str = _SIZE_FMT(best["price"], best["size"])
+                else:
+                    lay_str = "—"
+
+                buf.write(_PRICE_ROW(sel=sel_id, last=last_str, back=back_str, lay=lay_str))
+                if buf.full:
+                    break
+
+            if len(runners) > 20 and not buf.full:
+                buf.write(f"| *...and {len(runners) - 20} more runners* | | | |\n")
+        buf.write("\n")
+        if buf.full:
+            break
+
+    if total > MAX_LIST_ITEMS and not buf.full:
+        buf.write(f"*Showing {MAX_LIST_ITEMS} of {total} markets (use data field for full list)*")
+
+    return buf.summary()
+
+
+def format_json(
+    data: List[Dict[str, Any]],
+    max_items: int = MAX_LIST_ITEMS,
+    key: Optional[Callable[[Dict[str, Any]], Any]] = None,
+    reverse: bool = False,
+) -> Summary:
+    """
+    Format a tool's data list as compact JSON.
 
-                lines.append(f"| {sel_id} | {last_str} | {back_str} | {lay_str} |")
+    Args:
+        data: List of dicts returned by any list/price tool
+        max_items: Maximum number of items to include
+        key: Optional ranking key; when given, the max_items smallest
+            items (largest with reverse=True) are kept, in ranked order
+        reverse: Keep the largest items by key instead of the smallest
 
-            if len(runners) > 20:
-                lines.append(f"| *...and {len(runners) - 20} more runners* | | | |")
-        lines.append("")
+    Returns:
+        Summary with a JSON array of up to max_items items, with trailing
+        items dropped until it fits MAX_SUMMARY_LENGTH; truncated if any
+        item was left out
+    """
+    if key is None:
+        selected = data[:max_items]
+    elif reverse:
+        selected = nlargest(max_items, data, key=key)
+    else:
+        selected = nsmallest(max_items, data, key=key)
+
+    # Encode items one by one so the longest fitting prefix is found
+    # without re-encoding; "[" + items joined by "," + "]"
+    parts: list[str] = []
+    size = 2
+    for item in selected:
+        encoded = orjson.dumps(item).decode()
+        size += len(encoded) + (1 if parts else 0)
+        if size > MAX_SUMMARY_LENGTH:
+            break
+        parts.append(encoded)
+
+    return Summary("[" + ",".join(parts) + "]", len(parts) < len(data))
+
+
+def format_competitions_json(data: List[Dict[str, Any]]) -> Summary:
+    """
+    Format competitions as compact JSON.
 
-    if total > MAX_LIST_ITEMS:
-        lines.append(f"*Showing {MAX_LIST_ITEMS} of {total} markets (use data field for full list)*")
+    Args:
+        data: List of competitions from list_competitions
 
-    result = "\\n".join(lines)
-    return result[:MAX_SUMMARY_LENGTH]
+    Returns:
+        Summary with the same top MAX_TABLE_ROWS competitions by market
+        count as format_competitions, as a JSON array
+    """
+    return format_json(data, MAX_TABLE_ROWS, key=_BY_MARKET_COUNT, reverse=True)
@@ -3,14 +3,25 @@ Pydantic models for MCP tool inputs and outputs.
 
 This module defines strongly-typed models for tool parameters,
 providing validation and better error messages.
+
+Input models are Pydantic dataclasses rather than BaseModel subclasses:
+they are validated on every tool call but never use BaseModel features
+(serialisation, copying, extra config), so the lighter construction path
+is sufficient.
+
+The output model, ToolResult, is a plain slotted stdlib dataclass: it is
+built by the server from already-validated data, so it skips validation.
 """
 
-from typing import List, Optional
+import dataclasses
+from typing import Any, Dict, List, Literal, Optional
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import Field, field_validator
+from pydantic.dataclasses import dataclass
 
 
-class ListEventsInput(BaseModel):
+@dataclass(frozen=True)
+class ListEventsInput:
     """Input parameters for listing events."""
 
     event_type_id: Optional[str] = Field(
@@ -25,18 +36,34 @@ class ListEventsInput(BaseModel):
         default=None,
         description="Text to search in event names",
     )
+    response_format: Literal["markdown", "json"] = Field(
+        default="markdown",
+        description=(
+            'Summary format: "markdown" (human-readable) or "json" '
+            "(compact, machine-readable)"
+        ),
+    )
 
 
-class ListCompetitionsInput(BaseModel):
+@dataclass(frozen=True)
+class ListCompetitionsInput:
     """Input parameters for listing competitions."""
 
     event_type_id: Optional[str] = Field(
         default=None,
         description="Sport ID to filter by (e.g., '1' for Soccer)",
     )
+    response_format: Literal["markdown", "json"] = Field(
+        default="markdown",
+        description=(
+            'Summary format: "markdown" (human-readable) or "json" '
+            "(compact, machine-readable)"
+        ),
+    )
 
 
-class ListMarketCatalogueInput(BaseModel):
+@dataclass(frozen=True)
+class ListMarketCatalogueInput:
     """Input parameters for listing market catalogue."""
 
     event_id: Optional[str] = Field(
@@ -61,6 +88,13 @@ class ListMarketCatalogueInput(BaseModel):
         le=1000,
         description="Maximum markets to return (1-1000)",
     )
+    response_format: Literal["markdown", "json"] = Field(
+        default="markdown",
+        description=(
+            'Summary format: "markdown" (human-readable) or "json" '
+            "(compact, machine-readable)"
+        ),
+    )
 
     @field_validator("max_results")
     @classmethod
@@ -73,7 +107,8 @@ class ListMarketCatalogueInput(BaseModel):
         return v
 
 
-class GetMarketPricesInput(BaseModel):
+@dataclass(frozen=True)
+class GetMarketPricesInput:
     """Input parameters for getting market prices."""
 
     market_ids: List[str] = Field(
@@ -82,6 +117,13 @@ class GetMarketPricesInput(BaseModel):
         max_length=250,
         description="List of market IDs to get prices for (1-250)",
     )
+    response_format: Literal["markdown", "json"] = Field(
+        default="markdown",
+        description=(
+            'Summary format: "markdown" (human-readable) or "json" '
+            "(compact, machine-readable)"
+        ),
+    )
 
     @field_validator("market_ids")
     @classmethod
@@ -91,7 +133,16 @@ class GetMarketPricesInput(BaseModel):
             raise ValueError("At least one market_id is required")
         if len(v) > 250:
             raise ValueError("Cannot request more than 250 markets (Betfair API limit)")
-        # Ensure no empty strings
-        if any(not mid.strip() for mid in v):
+        # Ensure no empty or whitespace-only strings (no per-item strip() copy)
+        if any(not mid or mid.isspace() for mid in v):
             raise ValueError("Market IDs cannot be empty strings")
         return v
+
+
+@dataclasses.dataclass(slots=True)
+class ToolResult:
+    """Response envelope shared by the list tools."""
+
+    summary: str
+    data: List[Dict[str, Any]]
+    metadata: Dict[str, Any]
@@ -9,12 +9,56 @@ This module provides rate limiting to ensure compliance with Betfair API limits:
 
 import asyncio
 import logging
-from typing import Dict, Optional
-
-from aiolimiter import AsyncLimiter
+import sys
+import time
+from collections import OrderedDict
 
 logger = logging.getLogger(__name__)
 
+# Number of insert-lock shards for per-market limiters (power of two so the
+# shard index is a cheap mask of the key hash)
+MARKET_LOCK_SHARDS = 16
+
+
+class TokenBucket:
+    """
+    Token-bucket rate limiter for use within a single asyncio event loop.
+
+    Allows bursts of up to ``max_rate`` operations and refills continuously
+    at ``max_rate / time_period`` tokens per second. Bucket state is only
+    read and updated between awaits, so no lock is needed; a caller that
+    must wait sleeps outside any critical section and re-checks on wake,
+    so waiters never queue behind each other's sleeps.
+    """
+
+    __slots__ = ("rate", "capacity", "tokens", "last")
+
+    def __init__(self, max_rate: float, time_period: float = 60):
+        """
+        Initialize a full bucket.
+
+        Args:
+            max_rate: Maximum number of operations per time period
+            time_period: Length of the time period in seconds
+        """
+        self.rate = max_rate / time_period
+        self.capacity = float(max_rate)
+        self.tokens = float(max_rate)
+        self.last = time.monotonic()
+
+    async def acquire(self) -> None:
+        """Wait until a token is available, then consume it."""
+        while True:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+            self.last = now
+
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+
+            await asyncio.sleep((1 - self.tokens) / self.rate)
+
 
 class BetfairRateLimiter:
     """
@@ -26,20 +70,29 @@ class BetfairRateLimiter:
     - General operations: Conservative limits to prevent throttling
     """
 
-    def __init__(self):
-        """Initialize rate limiters for different operation types."""
+    def __init__(self, max_market_limiters: int = 1000):
+        """
+        Initialize rate limiters for different operation types.
+
+        Args:
+            max_market_limiters: Maximum number of per-market limiters kept
+                before the least recently used one is evicted
+        """
         # Login rate limiter: 100 requests per minute (Betfair hard limit)
         # Using 95/minute to leave 5% safety margin (P2-3 fix)
-        self.login_limiter = AsyncLimiter(max_rate=95, time_period=60)
+        self.login_limiter = TokenBucket(max_rate=95, time_period=60)
 
         # General API rate limiter: Conservative 20 requests per second
         # Betfair doesn't have a hard limit, but this prevents TOO_MANY_REQUESTS
-        self.general_limiter = AsyncLimiter(max_rate=20, time_period=1)
+        self.general_limiter = TokenBucket(max_rate=20, time_period=1)
 
         # Per-market rate limiters: 5 requests per second per market ID
-        # Dictionary to store limiters for each market ID
-        self._market_limiters: Dict[str, AsyncLimiter] = {}
-        self._market_limiters_lock = asyncio.Lock()
+        # Bounded LRU: hot markets stay resident, the coldest is evicted on insert
+        self._market_limiters: OrderedDict[str, TokenBucket] = OrderedDict()
+        # Sharded insert locks: cold-start inserts for different markets
+        # rarely contend on the same lock
+        self._insert_locks = tuple(asyncio.Lock() for _ in range(MARKET_LOCK_SHARDS))
+        self._max_market_limiters = max_market_limiters
 
     async def acquire_login(self) -> None:
         """
@@ -48,8 +101,11 @@ class BetfairRateLimiter:
         This enforces the 100 requests/minute limit for login operations.
         Blocks until permission is granted.
         """
-        logger.debug("Acquiring login rate limit token")
-        async with self.login_limiter:
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug("Acquiring login rate limit token")
+        await self.login_limiter.acquire()
+        if debug:
             logger.debug("Login rate limit token acquired")
 
     async def acquire_general(self) -> None:
@@ -59,8 +115,11 @@ class BetfairRateLimiter:
         This enforces a conservative rate limit to prevent TOO_MANY_REQUESTS.
         Blocks until permission is granted.
         """
-        logger.debug("Acquiring general API rate limit token")
-        async with self.general_limiter:
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug("Acquiring general API rate limit token")
+        await self.general_limiter.acquire()
+        if debug:
             logger.debug("General API rate limit token acquired")
 
     async def acquire_market(self, market_id: str) -> None:
@@ -73,18 +132,39 @@ class BetfairRateLimiter:
         Args:
             market_id: The market ID to rate limit
         """
-        # Get or create limiter for this market ID
-        async with self._market_limiters_lock:
-            if market_id not in self._market_limiters:
-                # 5 requests per second per market
-                self._market_limiters[market_id] = AsyncLimiter(max_rate=5, time_period=1)
-                logger.debug(f"Created rate limiter for market {market_id}")
-
-            limiter = self._market_limiters[market_id]
-
-        logger.debug(f"Acquiring market rate limit token for {market_id}")
-        async with limiter:
-            logger.debug(f"Market rate limit token acquired for {market_id}")
+        # Interned keys hit the dict's identity fast path on repeat lookups
+        market_id = sys.intern(market_id)
+        debug = logger.isEnabledFor(logging.DEBUG)
+
+        # Fast path: existing limiter, plain dict read without the lock
+        limiter = self._market_limiters.get(market_id)
+        if limiter is not None:
+            self._market_limiters.move_to_end(market_id)
+        else:
+            # Slow path: build the bucket (5 requests per second per market)
+            # before locking, so the critical section is just the dict ops;
+            # if another caller inserted first, the spare is discarded
+            new_limiter = TokenBucket(max_rate=5, time_period=1)
+            lock = self._insert_locks[hash(market_id) & (MARKET_LOCK_SHARDS - 1)]
+            async with lock:
+                if (
+                    market_id not in self._market_limiters
+                    and len(self._market_limiters) >= self._max_market_limiters
+                ):
+                    evicted, _ = self._market_limiters.popitem(last=False)
+                    if debug:
+                        logger.debug("Evicted rate limiter for market %s", evicted)
+                limiter = self._market_limiters.setdefault(market_id, new_limiter)
+            if debug and limiter is new_limiter:
+                logger.debug("Created rate limiter for market %s", market_id)
+
+        if debug:
+            logger.debug("Acquiring market rate limit token for %s", market_id)
+        # Sleeps (if any) happen inside this market's own bucket, so waiters
+        # on one market never hold up admissions for another
+        await limiter.acquire()
+        if debug:
+            logger.debug("Market rate limit token acquired for %s", market_id)
 
     async def acquire_markets(self, market_ids: list[str]) -> None:
         """
@@ -98,33 +178,15 @@ class BetfairRateLimiter:
             market_ids: List of market IDs to rate limit
         """
         # For batch requests, we use general limiter instead of per-market
-        # as the API allows requesting multiple markets in one call
-        await self.acquire_general()
-        logger.debug(f"Rate limit acquired for {len(market_ids)} markets in batch")
-
-    async def cleanup_old_limiters(self, max_limiters: int = 1000) -> None:
-        """
-        Cleanup old market limiters to prevent memory leaks.
-
-        Removes market limiters when the total count exceeds max_limiters,
-        keeping only the most recently used ones.
-
-        Args:
-            max_limiters: Maximum number of market limiters to keep
-        """
-        async with self._market_limiters_lock:
-            if len(self._market_limiters) > max_limiters:
-                # Remove oldest limiters (simple FIFO cleanup)
-                to_remove = len(self._market_limiters) - max_limiters
-                for market_id in list(self._market_limiters.keys())[:to_remove]:
-                    del self._market_limiters[market_id]
-                    logger.debug(f"Removed old rate limiter for market {market_id}")
-
-                logger.info(f"Cleaned up {to_remove} old market rate limiters")
+        # as the API allows requesting multiple markets in one call: a single
+        # admission token covers the whole batch regardless of its size
+        await self.general_limiter.acquire()
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Rate limit acquired for %d markets in batch", len(market_ids))
 
 
-# Global rate limiter instance
-_rate_limiter: Optional[BetfairRateLimiter] = None
+# Global rate limiter instance, built at import so lookups never branch
+_rate_limiter = BetfairRateLimiter()
 
 
 def get_rate_limiter() -> BetfairRateLimiter:
@@ -133,33 +195,5 @@ def get_rate_limiter() -> BetfairRateLimiter:
 
     Returns:
         BetfairRateLimiter: The global rate limiter
-
-    Raises:
-        RuntimeError: If rate limiter is not initialized
     """
-    global _rate_limiter
-    if _rate_limiter is None:
-        _rate_limiter = BetfairRateLimiter()
-        logger.info("Rate limiter initialized")
     return _rate_limiter
-
-
-async def cleanup_rate_limiter_task():
-    """
-    Background task to periodically cleanup old market limiters.
-
-    Runs every hour to prevent memory leaks from accumulating market limiters.
-    """
-    rate_limiter = get_rate_limiter()
-
-    while True:
-        try:
-            # Wait 1 hour
-            await asyncio.sleep(3600)
-
-            # Cleanup old limiters
-            await rate_limiter.cleanup_old_limiters()
-            logger.debug("Rate limiter cleanup completed")
-
-        except Exception as e:
-            logger.error(f"Error in rate limiter cleanup task: {e}")
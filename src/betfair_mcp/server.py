@@ -8,46 +8,73 @@ tools for interacting with the Betfair Exchange API.
 import asyncio
 import logging
 import os
+import sys
+import time
 from contextlib import asynccontextmanager
-from typing import Optional
+from typing import Any, Dict, List, Optional
 
+import orjson
 from betfairlightweight import APIClient  # P2-2: Type hint fix
 from dotenv import load_dotenv
 from fastmcp import FastMCP
 
 from .auth import BetfairSessionManager, create_session_manager_from_env
 from .formatters import (
+    MAX_LIST_ITEMS,
     format_account_balance,
     format_account_details,
+    format_account_snapshot,
     format_competitions,
+    format_competitions_json,
     format_event_types,
     format_events,
+    format_json,
     format_market_catalogue,
     format_market_prices,
+    Summary,
 )
 from .models import (
     GetMarketPricesInput,
     ListCompetitionsInput,
     ListEventsInput,
     ListMarketCatalogueInput,
+    ToolResult,
 )
-from .rate_limiter import get_rate_limiter, cleanup_rate_limiter_task
+from .rate_limiter import get_rate_limiter
 from .tools import account, events, markets
+from .utils.executor import install_executor
 
 # Load environment variables
 load_dotenv()
 
-# Configure logging
+# Configure logging (datefmt skips the default millisecond formatting)
 log_level = os.getenv("LOG_LEVEL", "INFO")
 logging.basicConfig(
     level=getattr(logging, log_level),
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    format="%(asctime)s %(name)s %(levelname)s %(message)s",
+    datefmt="%H:%M:%S",
 )
 logger = logging.getLogger(__name__)
 
 # Global session manager
 session_manager: Optional[BetfairSessionManager] = None
 
+# Shared rate limiter singleton, the same instance the tool modules use
+_rate_limiter = get_rate_limiter()
+
+# Keep-alive interval: 30 minutes, in integer nanoseconds
+KEEP_ALIVE_INTERVAL_NS = 30 * 60 * 1_000_000_000
+
+# Tool annotations shared by every handler (all tools are read-only queries
+# against Betfair); only live prices are non-idempotent
+_READONLY_IDEMPOTENT = {
+    "readOnlyHint": True,
+    "destructiveHint": False,
+    "idempotentHint": True,
+    "openWorldHint": True,
+}
+_READONLY_NONIDEMPOTENT = {**_READONLY_IDEMPOTENT, "idempotentHint": False}
+
 
 @asynccontextmanager
 async def lifespan(app):
@@ -62,10 +89,10 @@ async def lifespan(app):
     
     Lifecycle:
         1. __aenter__ (before yield): Server initialization
-           - Initialize rate limiter
+           - Install the bounded Betfair I/O thread pool
            - Create session manager from environment variables
            - Login to Betfair API
-           - Start background tasks (keep-alive, rate limiter cleanup)
+           - Start background tasks (keep-alive)
         
         2. yield: Server runs and handles MCP tool calls
         
@@ -81,15 +108,15 @@ async def lifespan(app):
         https://gofastmcp.com/servers/server
     """
     global session_manager
-    background_tasks = []  # Track tasks for clean shutdown (P1-2 fix)
+    keep_alive_task: Optional[asyncio.Task[None]] = None  # Tracked for clean shutdown (P1-2 fix)
     
     # STARTUP
     logger.info("Starting Betfair MCP server...")
     
     try:
-        # Initialize rate limiter
-        rate_limiter = get_rate_limiter()
-        logger.info("Rate limiter initialized")
+        # Bounded pool for blocking Betfair calls, installed once per loop so
+        # repeated sessions reuse it; asyncio.run() shuts it down on exit
+        install_executor(asyncio.get_running_loop())
 
         # Create session manager from environment variables
         session_manager = create_session_manager_from_env()
@@ -99,15 +126,10 @@ async def lifespan(app):
         await asyncio.to_thread(session_manager.ensure_logged_in)
         logger.info("Successfully logged in to Betfair")
 
-        # Start background tasks and TRACK them (P1-2 fix)
+        # Start the keep-alive task and TRACK it (P1-2 fix)
         keep_alive_task = asyncio.create_task(keep_alive_loop())
-        background_tasks.append(keep_alive_task)
         logger.info("Keep-alive loop started")
 
-        cleanup_task = asyncio.create_task(cleanup_rate_limiter_task())
-        background_tasks.append(cleanup_task)
-        logger.info("Rate limiter cleanup task started")
-
     except Exception as e:
         logger.error(f"Failed to initialize Betfair session: {e}")
         raise
@@ -118,29 +140,41 @@ async def lifespan(app):
     # SHUTDOWN
     logger.info("Shutting down Betfair MCP server...")
 
-    # Cancel background tasks FIRST (P1-2 fix)
-    for task in background_tasks:
-        task.cancel()
-    
-    # Wait for tasks to finish gracefully (P1-2 fix)
-    if background_tasks:
-        await asyncio.gather(*background_tasks, return_exceptions=True)
+    # Cancel the keep-alive task FIRST and wait for it to finish (P1-2 fix)
+    if keep_alive_task is not None:
+        keep_alive_task.cancel()
+        try:
+            await keep_alive_task
+        except (asyncio.CancelledError, Exception):
+            pass
         logger.info("Background tasks stopped")
 
     # Then logout
     if session_manager:
         try:
-            await asyncio.to_thread(session_manager.logout)
+            await session_manager.logout_async()
             logger.info("Successfully logged out from Betfair")
         except Exception as e:
             logger.error(f"Error during logout: {e}")
 
 
+def _serialize_tool_result(data: Any) -> str:
+    """
+    Serialize tool results to JSON text with orjson.
+
+    Replaces FastMCP's default pydantic-core encoder (indent=2) with
+    compact C-implemented encoding; dataclasses such as ToolResult are
+    handled natively and anything else unknown falls back to str().
+    """
+    return orjson.dumps(data, default=str).decode()
+
+
 # Initialize FastMCP server with correct API
 mcp = FastMCP(
     name="betfair",
     instructions="MCP server for Betfair Exchange API - provides read-only access to betting markets, odds, and account information",
-    lifespan=lifespan
+    lifespan=lifespan,
+    tool_serializer=_serialize_tool_result,
 )
 
 
@@ -149,29 +183,38 @@ async def keep_alive_loop():
     Background task to send periodic keep-alive requests with failure recovery.
 
     This prevents the Betfair session from timing out due to inactivity.
-    Keep-alive is sent every 30 minutes with rate limiting.
+    Keep-alive is sent every 30 minutes with rate limiting, scheduled
+    against a monotonic deadline so time spent in each keep-alive does not
+    accumulate as drift.
     
     On repeated failures (3 consecutive), attempts automatic re-login to recover
     the session. This ensures the server remains operational even after network
     issues or temporary API outages. (P2-1 fix)
     """
-    rate_limiter = get_rate_limiter()
     consecutive_failures = 0
     MAX_FAILURES = 3
+    deadline = time.monotonic_ns() + KEEP_ALIVE_INTERVAL_NS
 
     while True:
         try:
-            # Wait 30 minutes
-            await asyncio.sleep(30 * 60)
+            # Wait until the next 30-minute deadline
+            await asyncio.sleep(max(0, deadline - time.monotonic_ns()) / 1e9)
+
+            # Advance on a fixed schedule; if we fell behind (e.g. host
+            # suspend), restart from now rather than firing a burst
+            now = time.monotonic_ns()
+            deadline += KEEP_ALIVE_INTERVAL_NS
+            if deadline <= now:
+                deadline = now + KEEP_ALIVE_INTERVAL_NS
 
             if session_manager:
                 logger.debug("Sending keep-alive request")
                 
                 # Rate limit keep-alive (counts as login operation)
-                await rate_limiter.acquire_login()
+                await _rate_limiter.acquire_login()
                 
                 # Call keep_alive and check result (P2-1 fix)
-                success = await asyncio.to_thread(session_manager.keep_alive)
+                success = await session_manager.keep_alive_async()
                 
                 if success:
                     consecutive_failures = 0  # Reset on success
@@ -184,7 +227,7 @@ async def keep_alive_loop():
                     if consecutive_failures >= MAX_FAILURES:
                         logger.error("Too many keep-alive failures, attempting re-login")
                         try:
-                            await asyncio.to_thread(session_manager.logout)
+                            await session_manager.logout_async()
                             await asyncio.to_thread(session_manager.ensure_logged_in)
                             consecutive_failures = 0  # Reset after successful re-login
                             logger.info("Successfully re-logged in after keep-alive failures")
@@ -203,7 +246,7 @@ async def keep_alive_loop():
             if consecutive_failures >= MAX_FAILURES:
                 logger.critical("Keep-alive loop failed too many times, attempting recovery")
                 try:
-                    await asyncio.to_thread(session_manager.logout)
+                    await session_manager.logout_async()
                     await asyncio.to_thread(session_manager.ensure_logged_in)
                     consecutive_failures = 0
                     logger.info("Successfully recovered from repeated failures")
@@ -226,18 +269,37 @@ def get_client() -> APIClient:  # P2-2: Added return type hint
     return session_manager.get_client()
 
 
+def _wrap(summary: Summary, data: List[Dict[str, Any]], **extra: Any) -> ToolResult:
+    """
+    Build the standard list-tool response envelope.
+
+    Args:
+        summary: Formatter result (text plus truncated flag)
+        data: Items returned by the tool
+        **extra: Additional metadata keys, placed before summary_truncated
+
+    Returns:
+        ToolResult: summary/data/metadata response, serialised by FastMCP
+            to the same JSON object as the equivalent dict
+    """
+    n = len(data)
+    return ToolResult(
+        summary.text,
+        data,
+        {
+            "total": n,
+            "returned": n,
+            **extra,
+            "summary_truncated": summary.truncated,
+        },
+    )
+
+
 # ============================================================================
 # ACCOUNT TOOLS
 # ============================================================================
 
-@mcp.tool(
-    annotations={
-        "readOnlyHint": True,
-        "destructiveHint": False,
-        "idempotentHint": True,
-        "openWorldHint": True,
-    }
-)
+@mcp.tool(annotations=_READONLY_IDEMPOTENT)
 async def betfair_get_account_balance() -> dict:
     """
     Get current account balance and available funds.
@@ -259,19 +321,12 @@ async def betfair_get_account_balance() -> dict:
     client = get_client()
     data = await account.get_account_balance(client)
     return {
-        "summary": format_account_balance(data),
+        "summary": format_account_balance(data).text,
         "data": data,
     }
 
 
-@mcp.tool(
-    annotations={
-        "readOnlyHint": True,
-        "destructiveHint": False,
-        "idempotentHint": True,
-        "openWorldHint": True,
-    }
-)
+@mcp.tool(annotations=_READONLY_IDEMPOTENT)
 async def betfair_get_account_details() -> dict:
     """
     Get account details including personal information and settings.
@@ -294,7 +349,30 @@ async def betfair_get_account_details() -> dict:
     client = get_client()
     data = await account.get_account_details(client)
     return {
-        "summary": format_account_details(data),
+        "summary": format_account_details(data).text,
+        "data": data,
+    }
+
+
+@mcp.tool(annotations=_READONLY_IDEMPOTENT)
+async def betfair_get_account_snapshot() -> dict:
+    """
+    Get account balance and account details together.
+
+    Fetches both concurrently, so it is faster than calling
+    betfair_get_account_balance and betfair_get_account_details in turn.
+
+    Returns:
+        dict: Account snapshot with keys:
+            - summary: Markdown-formatted summary of both sections (str)
+            - data: Raw snapshot data (dict)
+                - balance: Same fields as betfair_get_account_balance data (dict)
+                - details: Same fields as betfair_get_account_details data (dict)
+    """
+    client = get_client()
+    data = await account.get_account_snapshot(client)
+    return {
+        "summary": format_account_snapshot(data).text,
         "data": data,
     }
 
@@ -303,15 +381,8 @@ async def betfair_get_account_details() -> dict:
 # EVENT TOOLS
 # ============================================================================
 
-@mcp.tool(
-    annotations={
-        "readOnlyHint": True,
-        "destructiveHint": False,
-        "idempotentHint": True,
-        "openWorldHint": True,
-    }
-)
-async def betfair_list_event_types() -> dict:
+@mcp.tool(annotations=_READONLY_IDEMPOTENT)
+async def betfair_list_event_types() -> ToolResult:
     """
     List all available event types (sports).
 
@@ -319,7 +390,7 @@ async def betfair_list_event_types() -> dict:
     Horse Racing, Tennis, Cricket, etc.
 
     Returns:
-        dict: Response with keys:
+        ToolResult: Response with fields:
             - summary: Markdown-formatted table (str, may be truncated)
             - data: List of event types (list[dict])
                 - event_type_id: Unique identifier for the sport (str)
@@ -332,27 +403,11 @@ async def betfair_list_event_types() -> dict:
     """
     client = get_client()
     data = await events.list_event_types(client)
-    summary = format_event_types(data)
-    return {
-        "summary": summary,
-        "data": data,
-        "metadata": {
-            "total": len(data),
-            "returned": len(data),
-            "summary_truncated": len(summary) >= 4000,
-        },
-    }
+    return _wrap(format_event_types(data), data)
 
 
-@mcp.tool(
-    annotations={
-        "readOnlyHint": True,
-        "destructiveHint": False,
-        "idempotentHint": True,
-        "openWorldHint": True,
-    }
-)
-async def betfair_list_events(params: ListEventsInput) -> dict:
+@mcp.tool(annotations=_READONLY_IDEMPOTENT)
+async def betfair_list_events(params: ListEventsInput) -> ToolResult:
     """
     List sporting events with optional filtering.
 
@@ -364,9 +419,10 @@ async def betfair_list_events(params: ListEventsInput) -> dict:
             - event_type_id: Sport ID to filter by, e.g., "1" for Soccer (optional)
             - competition_id: Competition ID to filter by (optional)
             - text_query: Text to search in event names (optional)
+            - response_format: "markdown" (default) or "json" summary (optional)
 
     Returns:
-        dict: Response with keys:
+        ToolResult: Response with fields:
             - summary: Markdown-formatted summary (str, may be truncated)
             - data: List of events (list[dict])
                 - event_id: Unique event identifier (str)
@@ -397,27 +453,15 @@ async def betfair_list_events(params: ListEventsInput) -> dict:
         competition_id=params.competition_id,
         text_query=params.text_query,
     )
-    summary = format_events(data)
-    return {
-        "summary": summary,
-        "data": data,
-        "metadata": {
-            "total": len(data),
-            "returned": len(data),
-            "summary_truncated": len(summary) >= 4000,
-        },
-    }
+    if params.response_format == "json":
+        summary = format_json(data, MAX_LIST_ITEMS)
+    else:
+        summary = format_events(data)
+    return _wrap(summary, data)
 
 
-@mcp.tool(
-    annotations={
-        "readOnlyHint": True,
-        "destructiveHint": False,
-        "idempotentHint": True,
-        "openWorldHint": True,
-    }
-)
-async def betfair_list_competitions(params: ListCompetitionsInput) -> dict:
+@mcp.tool(annotations=_READONLY_IDEMPOTENT)
+async def betfair_list_competitions(params: ListCompetitionsInput) -> ToolResult:
     """
     List competitions (leagues/tournaments).
 
@@ -427,10 +471,12 @@ async def betfair_list_competitions(params: ListCompetitionsInput) -> dict:
     Args:
         params: Filter parameters with fields:
             - event_type_id: Sport ID to filter by, e.g., "1" for Soccer (optional)
+            - response_format: "markdown" (default) or "json" summary (optional)
 
     Returns:
-        dict: Response with keys:
-            - summary: Markdown-formatted table (str, may be truncated)
+        ToolResult: Response with fields:
+            - summary: Markdown table or JSON array of the top 50 competitions
+              by market count (str, may be truncated)
             - data: List of competitions (list[dict])
                 - competition_id: Unique competition identifier (str)
                 - competition_name: Competition name, e.g., "Premier League" (str)
@@ -445,31 +491,19 @@ async def betfair_list_competitions(params: ListCompetitionsInput) -> dict:
         client,
         event_type_id=params.event_type_id,
     )
-    summary = format_competitions(data)
-    return {
-        "summary": summary,
-        "data": data,
-        "metadata": {
-            "total": len(data),
-            "returned": len(data),
-            "summary_truncated": len(summary) >= 4000,
-        },
-    }
+    if params.response_format == "json":
+        summary = format_competitions_json(data)
+    else:
+        summary = format_competitions(data)
+    return _wrap(summary, data)
 
 
 # ============================================================================
 # MARKET TOOLS
 # ============================================================================
 
-@mcp.tool(
-    annotations={
-        "readOnlyHint": True,
-        "destructiveHint": False,
-        "idempotentHint": True,
-        "openWorldHint": True,
-    }
-)
-async def betfair_list_market_catalogue(params: ListMarketCatalogueInput) -> dict:
+@mcp.tool(annotations=_READONLY_IDEMPOTENT)
+async def betfair_list_market_catalogue(params: ListMarketCatalogueInput) -> ToolResult:
     """
     List available betting markets with optional filtering.
 
@@ -483,9 +517,10 @@ async def betfair_list_market_catalogue(params: ListMarketCatalogueInput) -> dic
             - competition_id: Competition ID to filter by (optional)
             - market_type_codes: Market types, e.g., ["MATCH_ODDS", "OVER_UNDER_25"] (optional)
             - max_results: Maximum markets to return, default 100, max 1000 (optional)
+            - response_format: "markdown" (default) or "json" summary (optional)
 
     Returns:
-        dict: Response with keys:
+        ToolResult: Response with fields:
             - summary: Markdown-formatted summary (str, may be truncated)
             - data: List of markets (list[dict])
                 - market_id: Unique market identifier (str)
@@ -533,28 +568,15 @@ async def betfair_list_market_catalogue(params: ListMarketCatalogueInput) -> dic
         market_type_codes=params.market_type_codes,
         max_results=params.max_results,
     )
-    summary = format_market_catalogue(data)
-    return {
-        "summary": summary,
-        "data": data,
-        "metadata": {
-            "total": len(data),
-            "returned": len(data),
-            "max_results": params.max_results,
-            "summary_truncated": len(summary) >= 4000,
-        },
-    }
+    if params.response_format == "json":
+        summary = format_json(data, MAX_LIST_ITEMS)
+    else:
+        summary = format_market_catalogue(data)
+    return _wrap(summary, data, max_results=params.max_results)
 
 
-@mcp.tool(
-    annotations={
-        "readOnlyHint": True,
-        "destructiveHint": False,
-        "idempotentHint": False,
-        "openWorldHint": True,
-    }
-)
-async def betfair_get_market_prices(params: GetMarketPricesInput) -> dict:
+@mcp.tool(annotations=_READONLY_NONIDEMPOTENT)
+async def betfair_get_market_prices(params: GetMarketPricesInput) -> ToolResult:
     """
     Get current prices and odds for specified markets.
 
@@ -564,9 +586,10 @@ async def betfair_get_market_prices(params: GetMarketPricesInput) -> dict:
     Args:
         params: Request parameters with fields:
             - market_ids: List of market IDs to get prices for (1-250, required)
+            - response_format: "markdown" (default) or "json" summary (optional)
 
     Returns:
-        dict: Response with keys:
+        ToolResult: Response with fields:
             - summary: Markdown-formatted odds table (str, may be truncated)
             - data: List of market prices (list[dict])
                 - market_id: Market identifier (str)
@@ -586,7 +609,7 @@ async def betfair_get_market_prices(params: GetMarketPricesInput) -> dict:
             - metadata: Response metadata (dict)
                 - total: Total number of markets (int)
                 - returned: Number of markets in data field (int)
-                - requested: Number of market IDs requested (int)
+                - requested: Number of distinct market IDs requested (int)
                 - summary_truncated: Whether summary was truncated (bool)
 
     Example:
@@ -608,18 +631,15 @@ async def betfair_get_market_prices(params: GetMarketPricesInput) -> dict:
         # prices['data'][0]['runners'][0]['back_prices'] contains latest back odds
     """
     client = get_client()
-    data = await markets.get_market_prices(client, params.market_ids)
-    summary = format_market_prices(data)
-    return {
-        "summary": summary,
-        "data": data,
-        "metadata": {
-            "total": len(data),
-            "returned": len(data),
-            "requested": len(params.market_ids),
-            "summary_truncated": len(summary) >= 4000,
-        },
-    }
+    # Order-preserving dedup, so repeated IDs are not sent (or rate-limited)
+    # twice; interned IDs hash once and compare by identity downstream
+    market_ids = list(dict.fromkeys(map(sys.intern, params.market_ids)))
+    data = await markets.get_market_prices(client, market_ids)
+    if params.response_format == "json":
+        summary = format_json(data, MAX_LIST_ITEMS)
+    else:
+        summary = format_market_prices(data)
+    return _wrap(summary, data, requested=len(market_ids))
 
 
 if __name__ == "__main__":
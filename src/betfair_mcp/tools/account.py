@@ -13,9 +13,13 @@ from betfairlightweight.exceptions import BetfairError
 
 from ..rate_limiter import get_rate_limiter
 from ..error_handling import classify_betfair_error, log_api_error
+from ..utils.executor import run_blocking
 
 logger = logging.getLogger(__name__)
 
+# Process-wide singleton, bound once instead of looked up on every call
+_rate_limiter = get_rate_limiter()
+
 
 async def get_account_balance(client: Any) -> Dict[str, Any]:
     """
@@ -39,27 +43,18 @@ async def get_account_balance(client: Any) -> Dict[str, Any]:
     Raises:
         BetfairError: If the API request fails
     """
-    rate_limiter = get_rate_limiter()
-
     try:
         logger.info("Fetching account balance")
 
         # Apply rate limiting
-        await rate_limiter.acquire_general()
+        await _rate_limiter.acquire_general()
 
-        # Call the sync API in a thread pool
-        funds = await asyncio.to_thread(client.account.get_account_funds)
+        # Call the sync API in the default executor
+        funds = await run_blocking(client.account.get_account_funds)
 
-        result = {
-            "available_to_bet": float(funds.available_to_bet_balance),
-            "exposure": float(funds.exposure),
-            "retained_commission": float(funds.retained_commission),
-            "exposure_limit": float(funds.exposure_limit),
-            "discount_rate": float(funds.discount_rate),
-            "wallet": funds.wallet,
-        }
+        result = _funds_to_dict(funds)
 
-        logger.info(f"Account balance retrieved: £{result['available_to_bet']:.2f} available")
+        logger.info("Account balance retrieved: £%.2f available", result["available_to_bet"])
         return result
 
     except BetfairError as e:
@@ -67,7 +62,7 @@ async def get_account_balance(client: Any) -> Dict[str, Any]:
         log_api_error(classified_error, "get_account_balance")
         raise classified_error
     except Exception as e:
-        logger.error(f"Unexpected error fetching account balance: {e}")
+        logger.error("Unexpected error fetching account balance: %s", e)
         raise
 
 
@@ -91,34 +86,102 @@ async def get_account_details(client: Any) -> Dict[str, Any]:
     Raises:
         BetfairError: If the API request fails
     """
-    rate_limiter = get_rate_limiter()
-
     try:
         logger.info("Fetching account details")
 
         # Apply rate limiting
-        await rate_limiter.acquire_general()
+        await _rate_limiter.acquire_general()
+
+        # Call the sync API in the default executor
+        details = await run_blocking(client.account.get_account_details)
+
+        result = _details_to_dict(details)
+
+        logger.info(
+            "Account details retrieved for %s %s", result["first_name"], result["last_name"]
+        )
+        return result
+
+    except BetfairError as e:
+        classified_error = classify_betfair_error(e)
+        log_api_error(classified_error, "get_account_details")
+        raise classified_error
+    except Exception as e:
+        logger.error("Unexpected error fetching account details: %s", e)
+        raise
+
 
-        # Call the sync API in a thread pool
-        details = await asyncio.to_thread(client.account.get_account_details)
+async def get_account_snapshot(client: Any) -> Dict[str, Any]:
+    """
+    Get account balance and account details in one call.
+
+    The two underlying API requests are independent, so they are rate
+    limited and sent concurrently: wall time is that of the slower call
+    rather than the sum of both.
+
+    Args:
+        client: The betfairlightweight API client
+
+    Returns:
+        Dict containing:
+            - balance: Same fields as get_account_balance
+            - details: Same fields as get_account_details
+
+    Raises:
+        BetfairError: If either API request fails
+    """
+    try:
+        logger.info("Fetching account snapshot")
+
+        # Apply rate limiting (one token per request, acquired together)
+        await asyncio.gather(_rate_limiter.acquire_general(), _rate_limiter.acquire_general())
+
+        # Call both sync APIs in the default executor concurrently
+        funds, details = await asyncio.gather(
+            run_blocking(client.account.get_account_funds),
+            run_blocking(client.account.get_account_details),
+        )
 
         result = {
-            "first_name": details.first_name,
-            "last_name": details.last_name,
-            "currency_code": details.currency_code,
-            "locale_code": details.locale_code,
-            "timezone": details.timezone,
-            "discount_rate": float(details.discount_rate),
-            "points_balance": int(details.points_balance),
+            "balance": _funds_to_dict(funds),
+            "details": _details_to_dict(details),
         }
 
-        logger.info(f"Account details retrieved for {result['first_name']} {result['last_name']}")
+        logger.info(
+            "Account snapshot retrieved: £%.2f available",
+            result["balance"]["available_to_bet"],
+        )
         return result
 
     except BetfairError as e:
         classified_error = classify_betfair_error(e)
-        log_api_error(classified_error, "get_account_details")
+        log_api_error(classified_error, "get_account_snapshot")
         raise classified_error
     except Exception as e:
-        logger.error(f"Unexpected error fetching account details: {e}")
+        logger.error("Unexpected error fetching account snapshot: %s", e)
         raise
+
+
+def _funds_to_dict(funds: Any) -> Dict[str, Any]:
+    """Convert an AccountFunds response to the balance dict."""
+    return {
+        "available_to_bet": float(funds.available_to_bet_balance),
+        "exposure": float(funds.exposure),
+        "retained_commission": float(funds.retained_commission),
+        "exposure_limit": float(funds.exposure_limit),
+        "discount_rate": float(funds.discount_rate),
+        "wallet": funds.wallet,
+    }
+
+
+def _details_to_dict(details: Any) -> Dict[str, Any]:
+    """Convert an AccountDetails response to the details dict."""
+    return {
+        "first_name": details.first_name,
+        "last_name": details.last_name,
+        "currency_code": details.currency_code,
+        "locale_code": details.locale_code,
+        "timezone": details.timezone,
+        "discount_rate": float(details.discount_rate),
+        "points_balance": int(details.points_balance),
+    }
@@ -5,7 +5,6 @@ This module provides tools for querying sporting events, event types,
 and competitions available on the Betfair Exchange.
 """
 
-import asyncio
 import logging
 from datetime import datetime
 from typing import Any, Dict, List, Optional
@@ -15,9 +14,23 @@ from betfairlightweight.filters import market_filter
 
 from ..rate_limiter import get_rate_limiter
 from ..error_handling import classify_betfair_error, log_api_error
+from ..utils.cache import TTLCache
+from ..utils.executor import run_blocking
 
 logger = logging.getLogger(__name__)
 
+# Process-wide singleton, bound once instead of looked up on every call
+_rate_limiter = get_rate_limiter()
+
+# Sports and competitions change on the scale of hours, so results are
+# reused for 5 minutes (cached lists are shared: treat as read-only)
+REFERENCE_DATA_TTL = 300
+_event_types_cache: TTLCache[List[Dict[str, Any]]] = TTLCache(ttl=REFERENCE_DATA_TTL, maxsize=1)
+_competitions_cache: TTLCache[List[Dict[str, Any]]] = TTLCache(ttl=REFERENCE_DATA_TTL)
+
+# Unfiltered market filter, shared read-only across requests
+_EMPTY_FILTER = market_filter()
+
 
 async def list_event_types(client: Any) -> List[Dict[str, Any]]:
     """
@@ -29,6 +42,8 @@ async def list_event_types(client: Any) -> List[Dict[str, Any]]:
     Args:
         client: The betfairlightweight API client
 
+    Results are cached for REFERENCE_DATA_TTL seconds.
+
     Returns:
         List of dicts, each containing:
             - event_type_id: Unique identifier for the sport
@@ -38,39 +53,46 @@ async def list_event_types(client: Any) -> List[Dict[str, Any]]:
     Raises:
         BetfairError: If the API request fails
     """
-    rate_limiter = get_rate_limiter()
+    cached = _event_types_cache.get(())
+    if cached is not None:
+        logger.debug("Returning %d cached event types", len(cached))
+        return cached
 
     try:
         logger.info("Fetching event types")
 
         # Apply rate limiting
-        await rate_limiter.acquire_general()
+        await _rate_limiter.acquire_general()
 
-        # Create a filter for all markets
-        filter_obj = market_filter()
-
-        # Call the sync API in a thread pool
-        event_types = await asyncio.to_thread(
-            client.betting.list_event_types, filter=filter_obj
+        # Call the sync API in the default executor (filter: all markets)
+        event_types = await run_blocking(
+            client.betting.list_event_types, filter=_EMPTY_FILTER
         )
 
-        # DEBUG: Log raw API response
-        logger.info(f"RAW API RESPONSE: event_types type={type(event_types)}, len={len(event_types) if hasattr(event_types, '__len__') else 'N/A'}")
-        if event_types:
-            logger.info(f"FIRST EVENT TYPE: {event_types[0] if len(event_types) > 0 else 'NONE'}")
-        else:
+        # Raw response shape is only logged at DEBUG
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "RAW API RESPONSE: event_types type=%s, len=%d",
+                type(event_types).__name__,
+                len(event_types),
+            )
+        if not event_types:
             logger.warning("API RETURNED EMPTY LIST!")
 
+        # Betfair returns event type, event and competition IDs as JSON
+        # strings, so they are passed through without str()
         result = [
             {
-                "event_type_id": str(et.event_type.id),
+                "event_type_id": et.event_type.id,
                 "event_type_name": et.event_type.name,
                 "market_count": et.market_count,
             }
             for et in event_types
         ]
 
-        logger.info(f"Retrieved {len(result)} event types")
+        logger.info("Retrieved %d event types", len(result))
+        if result:  # an empty response is more likely transient than real
+            _event_types_cache.set((), result)
         return result
 
     except BetfairError as e:
@@ -78,7 +100,7 @@ async def list_event_types(client: Any) -> List[Dict[str, Any]]:
         log_api_error(classified_error, "list_event_types")
         raise classified_error
     except Exception as e:
-        logger.error(f"Unexpected error fetching event types: {e}")
+        logger.error("Unexpected error fetching event types: %s", e)
         raise
 
 
@@ -112,16 +134,16 @@ async def list_events(
     Raises:
         BetfairError: If the API request fails
     """
-    rate_limiter = get_rate_limiter()
-
     try:
         logger.info(
-            f"Fetching events (event_type_id={event_type_id}, "
-            f"competition_id={competition_id}, text_query={text_query})"
+            "Fetching events (event_type_id=%s, competition_id=%s, text_query=%s)",
+            event_type_id,
+            competition_id,
+            text_query,
         )
 
         # Apply rate limiting
-        await rate_limiter.acquire_general()
+        await _rate_limiter.acquire_general()
 
         # Build filter
         filter_params = {}
@@ -132,24 +154,26 @@ async def list_events(
         if text_query:
             filter_params["text_query"] = text_query
 
-        filter_obj = market_filter(**filter_params)
-
-        # Call the sync API in a thread pool
-        events = await asyncio.to_thread(client.betting.list_events, filter=filter_obj)
-
-        result = [
-            {
-                "event_id": str(event.event.id),
-                "event_name": event.event.name,
-                "event_timezone": event.event.timezone,
-                "open_date": event.event.open_date.isoformat() if event.event.open_date else None,
-                "country_code": event.event.country_code,
-                "market_count": event.market_count,
-            }
-            for event in events
-        ]
-
-        logger.info(f"Retrieved {len(result)} events")
+        filter_obj = market_filter(**filter_params) if filter_params else _EMPTY_FILTER
+
+        # Call the sync API in the default executor
+        events = await run_blocking(client.betting.list_events, filter=filter_obj)
+
+        # Bind the nested event object once per item
+        result = []
+        for event_result in events:
+            ev = event_result.event
+            open_date = ev.open_date
+            result.append({
+                "event_id": ev.id,
+                "event_name": ev.name,
+                "event_timezone": ev.timezone,
+                "open_date": open_date.isoformat() if open_date else None,
+                "country_code": ev.country_code,
+                "market_count": event_result.market_count,
+            })
+
+        logger.info("Retrieved %d events", len(result))
         return result
 
     except BetfairError as e:
@@ -157,7 +181,7 @@ async def list_events(
         log_api_error(classified_error, "list_events")
         raise classified_error
     except Exception as e:
-        logger.error(f"Unexpected error fetching events: {e}")
+        logger.error("Unexpected error fetching events: %s", e)
         raise
 
 
@@ -169,6 +193,7 @@ async def list_competitions(
     List competitions (leagues/tournaments) with optional filtering.
 
     This tool returns available competitions/leagues for a given sport.
+    Results are cached per event_type_id for REFERENCE_DATA_TTL seconds.
 
     Args:
         client: The betfairlightweight API client
@@ -183,36 +208,42 @@ async def list_competitions(
     Raises:
         BetfairError: If the API request fails
     """
-    rate_limiter = get_rate_limiter()
+    cache_key = (event_type_id,)
+    cached = _competitions_cache.get(cache_key)
+    if cached is not None:
+        logger.debug("Returning %d cached competitions", len(cached))
+        return cached
 
     try:
-        logger.info(f"Fetching competitions (event_type_id={event_type_id})")
+        logger.info("Fetching competitions (event_type_id=%s)", event_type_id)
 
         # Apply rate limiting
-        await rate_limiter.acquire_general()
+        await _rate_limiter.acquire_general()
 
         # Build filter
         filter_params = {}
         if event_type_id:
             filter_params["event_type_ids"] = [event_type_id]
 
-        filter_obj = market_filter(**filter_params)
+        filter_obj = market_filter(**filter_params) if filter_params else _EMPTY_FILTER
 
-        # Call the sync API in a thread pool
-        competitions = await asyncio.to_thread(
+        # Call the sync API in the default executor
+        competitions = await run_blocking(
             client.betting.list_competitions, filter=filter_obj
         )
 
         result = [
             {
-                "competition_id": str(comp.competition.id),
+                "competition_id": comp.competition.id,
                 "competition_name": comp.competition.name,
                 "market_count": comp.market_count,
             }
             for comp in competitions
         ]
 
-        logger.info(f"Retrieved {len(result)} competitions")
+        logger.info("Retrieved %d competitions", len(result))
+        if result:  # an empty response is more likely transient than real
+            _competitions_cache.set(cache_key, result)
         return result
 
     except BetfairError as e:
@@ -220,5 +251,5 @@ async def list_competitions(
         log_api_error(classified_error, "list_competitions")
         raise classified_error
     except Exception as e:
-        logger.error(f"Unexpected error fetching competitions: {e}")
+        logger.error("Unexpected error fetching competitions: %s", e)
         raise
@@ -6,8 +6,9 @@ and market information from the Betfair Exchange.
 """
 
 import asyncio
+import itertools
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from betfairlightweight.exceptions import BetfairError
 from betfairlightweight.filters import market_filter, price_projection
@@ -15,9 +16,34 @@ from betfairlightweight.filters import market_filter, price_projection
 from ..rate_limiter import get_rate_limiter
 from ..weight_calculator import MarketDataWeightCalculator
 from ..error_handling import classify_betfair_error, log_api_error
+from ..utils.cache import TTLCache
+from ..utils.executor import run_blocking
 
 logger = logging.getLogger(__name__)
 
+# Process-wide singleton, bound once instead of looked up on every call
+_rate_limiter = get_rate_limiter()
+
+# Fixed projections requested by this module (tuples: their per-market
+# weights are cached by MarketDataWeightCalculator after the first check)
+_CATALOGUE_PROJECTION = ("COMPETITION", "EVENT", "RUNNER_DESCRIPTION", "MARKET_DESCRIPTION")
+_PRICE_DATA = ("EX_BEST_OFFERS", "EX_TRADED")
+
+# Price projection for full depth; betfairlightweight only reads it when
+# serialising the request, so one shared instance is safe
+_PRICES_PROJ = price_projection(price_data=_PRICE_DATA, virtualise=True)
+
+# Concurrent identical price requests share a single fetch (single-flight),
+# and repeats within PRICE_CACHE_TTL seconds reuse its result
+PRICE_CACHE_TTL = 0.5
+_inflight_prices: Dict[Tuple[str, ...], "asyncio.Task[List[Dict[str, Any]]]"] = {}
+_recent_prices: TTLCache[List[Dict[str, Any]]] = TTLCache(ttl=PRICE_CACHE_TTL)
+
+# Parsed catalogue results reused for identical filters within
+# CATALOGUE_CACHE_TTL seconds (cached lists are shared: treat as read-only)
+CATALOGUE_CACHE_TTL = 5
+_recent_catalogues: TTLCache[List[Dict[str, Any]]] = TTLCache(ttl=CATALOGUE_CACHE_TTL)
+
 
 async def list_market_catalogue(
     client: Any,
@@ -31,7 +57,8 @@ async def list_market_catalogue(
     List available betting markets with optional filtering.
 
     This tool returns detailed information about betting markets,
-    including runners and market descriptions.
+    including runners and market descriptions. Results for identical
+    filters are reused for CATALOGUE_CACHE_TTL seconds.
 
     Args:
         client: The betfairlightweight API client
@@ -58,26 +85,31 @@ async def list_market_catalogue(
     Raises:
         BetfairError: If the API request fails
     """
-    rate_limiter = get_rate_limiter()
+    cache_key = (
+        event_id,
+        event_type_id,
+        competition_id,
+        tuple(market_type_codes or ()),
+        max_results,
+    )
+    cached = _recent_catalogues.get(cache_key)
+    if cached is not None:
+        logger.debug("Returning %d cached markets", len(cached))
+        return cached
 
     try:
         logger.info(
-            f"Fetching market catalogue (event_id={event_id}, "
-            f"event_type_id={event_type_id}, max_results={max_results})"
+            "Fetching market catalogue (event_id=%s, event_type_id=%s, max_results=%d)",
+            event_id,
+            event_type_id,
+            max_results,
         )
 
-        # Market projections requested
-        market_projection = ["COMPETITION", "EVENT", "RUNNER_DESCRIPTION", "MARKET_DESCRIPTION"]
-
         # Validate weight for the request
-        weight = MarketDataWeightCalculator.calculate_market_catalogue_weight(
-            num_markets=max_results,
-            market_projection=market_projection,
-        )
-        MarketDataWeightCalculator.validate_weight(weight, "list_market_catalogue")
+        MarketDataWeightCalculator.assert_catalogue_weight(max_results, _CATALOGUE_PROJECTION)
 
         # Apply rate limiting
-        await rate_limiter.acquire_general()
+        await _rate_limiter.acquire_general()
 
         # Build filter
         filter_params = {}
@@ -92,41 +124,44 @@ async def list_market_catalogue(
 
         filter_obj = market_filter(**filter_params)
 
-        # Call the sync API in a thread pool
-        markets = await asyncio.to_thread(
+        # Call the sync API in the default executor
+        markets = await run_blocking(
             client.betting.list_market_catalogue,
             filter=filter_obj,
             max_results=max_results,
-            market_projection=market_projection,
+            market_projection=_CATALOGUE_PROJECTION,
         )
 
+        # Attribute chains are bound to locals once per market/runner
         result = []
         for market in markets:
-            market_data = {
-                "market_id": market.market_id,
-                "market_name": market.market_name,
-                "market_type": market.description.market_type if market.description else None,
-                "event_name": market.event.name if market.event else None,
-                "competition_name": (
-                    market.competition.name if market.competition else None
-                ),
-                "event_id": str(market.event.id) if market.event else None,
-                "total_matched": float(market.total_matched) if market.total_matched else 0.0,
-                "runners": [],
-            }
+            desc, ev, comp = market.description, market.event, market.competition
+            matched = market.total_matched
 
             # Add runner information
-            if market.runners:
-                for runner in market.runners:
-                    market_data["runners"].append({
-                        "selection_id": str(runner.selection_id),
-                        "runner_name": runner.runner_name,
-                        "sort_priority": runner.sort_priority,
-                    })
-
-            result.append(market_data)
-
-        logger.info(f"Retrieved {len(result)} markets")
+            runners_out = [
+                {
+                    # selection_id is an int in the API; the tool contract is str
+                    "selection_id": str(runner.selection_id),
+                    "runner_name": runner.runner_name,
+                    "sort_priority": runner.sort_priority,
+                }
+                for runner in market.runners or ()
+            ]
+
+            result.append({
+                "market_id": market.market_id,
+                "market_name": market.market_name,
+                "market_type": desc.market_type if desc else None,
+                "event_name": ev.name if ev else None,
+                "competition_name": comp.name if comp else None,
+                "event_id": ev.id if ev else None,  # already a str
+                "total_matched": float(matched) if matched else 0.0,
+                "runners": runners_out,
+            })
+
+        logger.info("Retrieved %d markets", len(result))
+        _recent_catalogues.set(cache_key, result)
         return result
 
     except BetfairError as e:
@@ -134,7 +169,7 @@ async def list_market_catalogue(
         log_api_error(classified_error, "list_market_catalogue")
         raise classified_error
     except Exception as e:
-        logger.error(f"Unexpected error fetching market catalogue: {e}")
+        logger.error("Unexpected error fetching market catalogue: %s", e)
         raise
 
 
@@ -146,11 +181,15 @@ async def get_market_prices(
     Get current prices and odds for specified markets.
 
     This tool returns live betting odds, including back and lay prices,
-    for the specified markets.
+    for the specified markets. Concurrent calls for the same market IDs (in
+    the same order) share one API request, and its result is reused for
+    PRICE_CACHE_TTL seconds (the returned list is shared: treat it as
+    read-only). Requests above Betfair's per-request weight limit are
+    split into chunks that are fetched concurrently.
 
     Args:
         client: The betfairlightweight API client
-        market_ids: List of market IDs to get prices for (max 250)
+        market_ids: List of market IDs to get prices for
 
     Returns:
         List of dicts, each containing:
@@ -171,88 +210,66 @@ async def get_market_prices(
 
     Raises:
         BetfairError: If the API request fails
-        ValueError: If more than 250 market IDs provided
     """
-    if len(market_ids) > 250:
-        raise ValueError("Maximum 250 market IDs allowed per request")
-
-    rate_limiter = get_rate_limiter()
+    # Keyed on the ordered IDs so a shared result is always in the caller's
+    # request order (server.py has already de-duplicated them)
+    key = tuple(market_ids)
+    cached = _recent_prices.get(key)
+    if cached is not None:
+        return cached
+
+    # Join an identical in-flight request instead of issuing another one
+    task = _inflight_prices.get(key)
+    if task is None:
+        task = asyncio.ensure_future(_fetch_market_prices(client, market_ids))
+        _inflight_prices[key] = task
+        task.add_done_callback(lambda done: _finish_price_fetch(key, done))
+    # Shield so one caller cancelling does not cancel the shared fetch
+    return await asyncio.shield(task)
+
+
+def _finish_price_fetch(
+    key: Tuple[str, ...], task: "asyncio.Task[List[Dict[str, Any]]]"
+) -> None:
+    """Drop a finished fetch from the in-flight map and cache its result."""
+    _inflight_prices.pop(key, None)
+    if not task.cancelled() and task.exception() is None:
+        _recent_prices.set(key, task.result())
+
+
+async def _fetch_market_prices(
+    client: Any,
+    market_ids: List[str],
+) -> List[Dict[str, Any]]:
+    """
+    Fetch and parse market books (see get_market_prices).
 
+    Requests heavier than Betfair's weight limit are split into chunks
+    that are fetched concurrently; results keep the chunk order.
+    """
     try:
-        logger.info(f"Fetching prices for {len(market_ids)} markets")
-
-        # Price data requested
-        price_data = ["EX_BEST_OFFERS", "EX_TRADED"]
-
-        # Validate weight for the request
-        weight = MarketDataWeightCalculator.calculate_market_book_weight(
-            num_markets=len(market_ids),
-            price_data=price_data,
-        )
-        MarketDataWeightCalculator.validate_weight(weight, "get_market_prices")
-
-        # Apply rate limiting for batch market request
-        await rate_limiter.acquire_markets(market_ids)
-
-        # Create price projection for full depth
-        price_proj = price_projection(
-            price_data=price_data,
-            virtualise=True,
-        )
+        logger.info("Fetching prices for %d markets", len(market_ids))
 
-        # Call the sync API in a thread pool
-        market_books = await asyncio.to_thread(
-            client.betting.list_market_book,
-            market_ids=market_ids,
-            price_projection=price_proj,
+        chunks = MarketDataWeightCalculator.split_markets_by_weight(
+            market_ids, price_data=_PRICE_DATA
         )
-
-        result = []
-        for book in market_books:
-            market_data = {
-                "market_id": book.market_id,
-                "status": book.status,
-                "total_matched": float(book.total_matched) if book.total_matched else 0.0,
-                "runners": [],
-            }
-
-            # Add runner price information
-            if book.runners:
-                for runner in book.runners:
-                    runner_data = {
-                        "selection_id": str(runner.selection_id),
-                        "status": runner.status,
-                        "last_price_traded": (
-                            float(runner.last_price_traded) if runner.last_price_traded else None
-                        ),
-                        "total_matched": (
-                            float(runner.total_matched) if runner.total_matched else 0.0
-                        ),
-                        "back_prices": [],
-                        "lay_prices": [],
-                    }
-
-                    # Add back prices
-                    if runner.ex and runner.ex.available_to_back:
-                        for price_size in runner.ex.available_to_back[:3]:  # Top 3 prices
-                            runner_data["back_prices"].append({
-                                "price": float(price_size.price),
-                                "size": float(price_size.size),
-                            })
-
-                    # Add lay prices
-                    if runner.ex and runner.ex.available_to_lay:
-                        for price_size in runner.ex.available_to_lay[:3]:  # Top 3 prices
-                            runner_data["lay_prices"].append({
-                                "price": float(price_size.price),
-                                "size": float(price_size.size),
-                            })
-
-                    market_data["runners"].append(runner_data)
-
-            result.append(market_data)
-
-        logger.info(f"Retrieved prices for {len(result)} markets")
+        if len(chunks) == 1:
+            result = await _fetch_prices_chunk(client, chunks[0])
+        else:
+            # Overlap the HTTPS round trips; the rate limiter still admits
+            # each chunk's request within the API limits
+            tasks = [asyncio.ensure_future(_fetch_prices_chunk(client, c)) for c in chunks]
+            try:
+                chunk_results = await asyncio.gather(*tasks)
+            except BaseException:
+                # The other chunks' results would be discarded, so stop their
+                # fetches (TaskGroup would do this but needs Python 3.11)
+                for task in tasks:
+                    task.cancel()
+                raise
+            result = list(itertools.chain.from_iterable(chunk_results))
+
+        logger.info("Retrieved prices for %d markets", len(result))
         return result
 
     except BetfairError as e:
@@ -260,5 +277,88 @@ async def get_market_prices(
         log_api_error(classified_error, "get_market_prices")
         raise classified_error
     except Exception as e:
-        logger.error(f"Unexpected error fetching market prices: {e}")
+        logger.error("Unexpected error fetching market prices: %s", e)
         raise
+
+
+async def _fetch_prices_chunk(
+    client: Any,
+    market_ids: List[str],
+) -> List[Dict[str, Any]]:
+    """Fetch and parse one weight-limited chunk of market books."""
+    # Validate weight for the request
+    MarketDataWeightCalculator.assert_book_weight(
+        len(market_ids), _PRICE_DATA, operation="get_market_prices"
+    )
+
+    # Apply rate limiting for batch market request
+    await _rate_limiter.acquire_markets(market_ids)
+
+    # Call the sync API in the default executor
+    market_books = await run_blocking(
+        client.betting.list_market_book,
+        market_ids=market_ids,
+        price_projection=_PRICES_PROJ,
+    )
+
+    return _parse_market_books(market_books)
+
+
+def _parse_market_books(market_books: List[Any]) -> List[Dict[str, Any]]:
+    """Convert betfairlightweight MarketBook objects to price dicts."""
+    # Attribute chains and float are bound to locals once per
+    # market/runner: this loop runs for every runner x price level.
+    # Ladders are cut to 3 levels, so batching values through
+    # array('d')/NumPy costs more in setup than the float() calls it saves.
+    float_ = float
+    result = []
+    for book in market_books:
+        matched = book.total_matched
+
+        # Add runner price information
+        runners_out: List[Dict[str, Any]] = []
+        for runner in book.runners or ():
+            ex = runner.ex
+            atb = ex.available_to_back if ex else None
+            atl = ex.available_to_lay if ex else None
+            last_traded = runner.last_price_traded
+            runner_matched = runner.total_matched
+
+            # Add back prices. Plain loops on purpose: before Python 3.12
+            # (PEP 709) a comprehension runs in its own frame, which costs
+            # more than it saves over a 3-item ladder
+            back_prices = []
+            if atb:
+                for price_size in atb[:3]:  # Top 3 prices
+                    back_prices.append(
+                        {"price": float_(price_size.price), "size": float_(price_size.size)}
+                    )
+
+            # Add lay prices
+            lay_prices = []
+            if atl:
+                for price_size in atl[:3]:  # Top 3 prices
+                    lay_prices.append(
+                        {"price": float_(price_size.price), "size": float_(price_size.size)}
+                    )
+
+            # Built directly as dicts: the formatters and the JSON encoder
+            # consume dicts, and a NamedTuple staging step plus _asdict()
+            # measured ~4x slower than a dict literal per runner
+            runners_out.append({
+                "selection_id": str(runner.selection_id),
+                "status": runner.status,
+                "last_price_traded": float_(last_traded) if last_traded else None,
+                "total_matched": float_(runner_matched) if runner_matched else 0.0,
+                "back_prices": back_prices,
+                "lay_prices": lay_prices,
+            })
+
+        result.append({
+            "market_id": book.market_id,
+            "status": book.status,
+            "total_matched": float_(matched) if matched else 0.0,
+            "runners": runners_out,
+        })
+
+    return result
@@ -0,0 +1,70 @@
+"""
+Small in-process caches for slowly changing Betfair reference data.
+
+Cached values are the already-parsed tool results (lists of dicts), so a
+hit skips the rate limiter, the HTTPS round trip and the response parsing.
+Values are shared between callers and must be treated as read-only.
+"""
+
+import time
+from typing import Dict, Generic, Hashable, Optional, Tuple, TypeVar
+
+V = TypeVar("V")
+
+
+class TTLCache(Generic[V]):
+    """
+    Time-based cache mapping keys to values that expire after ``ttl`` seconds.
+
+    Only used from the event loop thread, so no locking is needed. When
+    ``maxsize`` entries are stored, the oldest insertion is evicted.
+    """
+
+    __slots__ = ("ttl", "maxsize", "_entries")
+
+    def __init__(self, ttl: float, maxsize: int = 128):
+        """
+        Initialize an empty cache.
+
+        Args:
+            ttl: Seconds an entry stays valid after it is stored
+            maxsize: Maximum number of entries kept
+        """
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: Dict[Hashable, Tuple[float, V]] = {}
+
+    def get(self, key: Hashable) -> Optional[V]:
+        """
+        Return the cached value for ``key``, or None if missing or expired.
+
+        Args:
+            key: Cache key (e.g. a tuple of filter parameters)
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expiry, value = entry
+        if time.monotonic() >= expiry:
+            del self._entries[key]
+            return None
+        return value
+
+    def set(self, key: Hashable, value: V) -> None:
+        """
+        Store ``value`` under ``key`` for ``ttl`` seconds.
+
+        Args:
+            key: Cache key
+            value: Value to cache (must not be None)
+        """
+        entries = self._entries
+        entries.pop(key, None)
+        if len(entries) >= self.maxsize:
+            # Dicts keep insertion order: the first key is the oldest entry
+            del entries[next(iter(entries))]
+        entries[key] = (time.monotonic() + self.ttl, value)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
@@ -0,0 +1,77 @@
+"""
+Helpers for running blocking betfairlightweight calls from async code.
+
+betfairlightweight is a synchronous (requests-based) client, so every API
+call is handed to a worker thread. ``asyncio.to_thread`` copies the current
+contextvars context and wraps the call in ``ctx.run`` on every hop; the
+tools never read context variables in the worker, so that work is skipped
+here.
+
+The server installs a small dedicated pool (see install_executor) as the
+loop's default executor at startup, so both run_blocking and any remaining
+asyncio.to_thread calls share it.
+"""
+
+import asyncio
+import functools
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, TypeVar
+
+T = TypeVar("T")
+
+# Betfair's rate limits cap useful concurrency far below asyncio's default
+# pool size of min(32, cpu_count + 4) threads
+MAX_WORKERS = 4
+
+# Loops that already run on a betfair-io pool (weak, so closed loops drop out)
+_installed_loops: "weakref.WeakSet[asyncio.AbstractEventLoop]" = weakref.WeakSet()
+
+
+def create_executor() -> ThreadPoolExecutor:
+    """
+    Create the bounded thread pool used for blocking Betfair I/O.
+
+    Returns:
+        ThreadPoolExecutor: Pool with MAX_WORKERS "betfair-io" threads
+    """
+    return ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="betfair-io")
+
+
+def install_executor(loop: asyncio.AbstractEventLoop) -> None:
+    """
+    Install a bounded pool as ``loop``'s default executor, once per loop.
+
+    The server lifespan runs once per client session; replacing the default
+    executor each time would orphan the previous pool and its threads. The
+    pool is shut down with the loop (``asyncio.run`` does this on exit).
+
+    Args:
+        loop: The running event loop
+    """
+    if loop in _installed_loops:
+        return
+    loop.set_default_executor(create_executor())
+    _installed_loops.add(loop)
+
+
+async def run_blocking(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    Run a blocking callable in the event loop's default executor.
+
+    Unlike ``asyncio.to_thread``, the caller's contextvars are NOT
+    propagated to the worker thread.
+
+    Args:
+        fn: Blocking callable (e.g. ``client.betting.list_market_book``)
+        *args: Positional arguments for ``fn``
+        **kwargs: Keyword arguments for ``fn``
+
+    Returns:
+        Whatever ``fn`` returns
+    """
+    loop = asyncio.get_running_loop()
+    if kwargs:
+        # run_in_executor only forwards positional arguments
+        return await loop.run_in_executor(None, functools.partial(fn, *args, **kwargs))
+    return await loop.run_in_executor(None, fn, *args)
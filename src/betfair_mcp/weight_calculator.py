@@ -8,8 +8,9 @@ market projections and price data have different weights.
 Reference: https://docs.developer.betfair.com/display/1smk3cen4v3lu3yomq5qye0ni/Market+Data+Request+Limits
 """
 
+import functools
 import logging
-from typing import List, Optional, Set
+from typing import List, Optional, Sequence, Set, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -50,6 +51,7 @@ class MarketDataWeightCalculator:
         "RUNNER_METADATA": 2,
         "MARKET_START_TIME": 1,
     }
+    MARKET_PROJECTION_KEYS = frozenset(MARKET_PROJECTION_WEIGHTS)
 
     # Price projection weights
     PRICE_PROJECTION_WEIGHTS = {
@@ -59,6 +61,7 @@ class MarketDataWeightCalculator:
         "SP_AVAILABLE": 1,
         "SP_TRADED": 1,
     }
+    PRICE_PROJECTION_KEYS = frozenset(PRICE_PROJECTION_WEIGHTS)
 
     # Base weight per market
     BASE_WEIGHT_PER_MARKET = 1
@@ -70,37 +73,28 @@ class MarketDataWeightCalculator:
     def calculate_market_catalogue_weight(
         cls,
         num_markets: int,
-        market_projection: Optional[List[str]] = None,
+        market_projection: Optional[Sequence[str]] = None,
     ) -> int:
         """
         Calculate weight for a listMarketCatalogue request.
 
         Args:
             num_markets: Number of markets in the request
-            market_projection: List of market projections requested
+            market_projection: Market projections requested (pass a tuple
+                to skip the conversion on the cached lookup)
 
         Returns:
             Total weight of the request
         """
-        if market_projection is None:
-            market_projection = []
-
-        # Start with base weight
-        weight_per_market = cls.BASE_WEIGHT_PER_MARKET
-
-        # Add weights for each projection
-        for projection in market_projection:
-            projection_upper = projection.upper()
-            if projection_upper in cls.MARKET_PROJECTION_WEIGHTS:
-                weight_per_market += cls.MARKET_PROJECTION_WEIGHTS[projection_upper]
-            else:
-                logger.warning(f"Unknown market projection: {projection}")
+        weight_per_market = _catalogue_weight_per_market(_as_tuple(market_projection))
 
         total_weight = num_markets * weight_per_market
 
         logger.debug(
-            f"Market catalogue weight: {total_weight} "
-            f"({num_markets} markets × {weight_per_market} points/market)"
+            "Market catalogue weight: %d (%d markets × %d points/market)",
+            total_weight,
+            num_markets,
+            weight_per_market,
         )
 
         return total_weight
@@ -109,7 +103,7 @@ class MarketDataWeightCalculator:
     def calculate_market_book_weight(
         cls,
         num_markets: int,
-        price_data: Optional[List[str]] = None,
+        price_data: Optional[Sequence[str]] = None,
         order_projection: bool = False,
         match_projection: bool = False,
     ) -> int:
@@ -118,38 +112,25 @@ class MarketDataWeightCalculator:
 
         Args:
             num_markets: Number of markets in the request
-            price_data: List of price projections requested
+            price_data: Price projections requested (pass a tuple to skip
+                the conversion on the cached lookup)
             order_projection: Whether order projection is requested
             match_projection: Whether match projection is requested
 
         Returns:
             Total weight of the request
         """
-        if price_data is None:
-            price_data = []
-
-        # Start with base weight
-        weight_per_market = cls.BASE_WEIGHT_PER_MARKET
-
-        # Add weights for price projections
-        for projection in price_data:
-            projection_upper = projection.upper()
-            if projection_upper in cls.PRICE_PROJECTION_WEIGHTS:
-                weight_per_market += cls.PRICE_PROJECTION_WEIGHTS[projection_upper]
-            else:
-                logger.warning(f"Unknown price projection: {projection}")
-
-        # Order and match projections add weight
-        if order_projection:
-            weight_per_market += 2  # Approximate weight for order projection
-        if match_projection:
-            weight_per_market += 2  # Approximate weight for match projection
+        weight_per_market = _book_weight_per_market(
+            _as_tuple(price_data), order_projection, match_projection
+        )
 
         total_weight = num_markets * weight_per_market
 
         logger.debug(
-            f"Market book weight: {total_weight} "
-            f"({num_markets} markets × {weight_per_market} points/market)"
+            "Market book weight: %d (%d markets × %d points/market)",
+            total_weight,
+            num_markets,
+            weight_per_market,
         )
 
         return total_weight
@@ -172,20 +153,76 @@ class MarketDataWeightCalculator:
                 f"Reduce the number of markets or requested data fields."
             )
 
-        logger.debug(f"{operation} weight ({weight}) is within limits")
+        logger.debug("%s weight (%d) is within limits", operation, weight)
+
+    @classmethod
+    def assert_catalogue_weight(
+        cls,
+        num_markets: int,
+        market_projection: Optional[Sequence[str]] = None,
+        operation: str = "list_market_catalogue",
+    ) -> int:
+        """
+        Calculate and validate a listMarketCatalogue weight in one call.
+
+        Args:
+            num_markets: Number of markets in the request
+            market_projection: Market projections requested
+            operation: Name of the operation (for the error message)
+
+        Returns:
+            Total weight of the request
+
+        Raises:
+            ValueError: If weight exceeds maximum
+        """
+        weight = num_markets * _catalogue_weight_per_market(_as_tuple(market_projection))
+        cls.validate_weight(weight, operation)
+        return weight
+
+    @classmethod
+    def assert_book_weight(
+        cls,
+        num_markets: int,
+        price_data: Optional[Sequence[str]] = None,
+        order_projection: bool = False,
+        match_projection: bool = False,
+        operation: str = "list_market_book",
+    ) -> int:
+        """
+        Calculate and validate a listMarketBook weight in one call.
+
+        Args:
+            num_markets: Number of markets in the request
+            price_data: Price projections requested
+            order_projection: Whether order projection is requested
+            match_projection: Whether match projection is requested
+            operation: Name of the operation (for the error message)
+
+        Returns:
+            Total weight of the request
+
+        Raises:
+            ValueError: If weight exceeds maximum
+        """
+        weight = num_markets * _book_weight_per_market(
+            _as_tuple(price_data), order_projection, match_projection
+        )
+        cls.validate_weight(weight, operation)
+        return weight
 
     @classmethod
     def calculate_max_markets(
         cls,
-        market_projection: Optional[List[str]] = None,
-        price_data: Optional[List[str]] = None,
+        market_projection: Optional[Sequence[str]] = None,
+        price_data: Optional[Sequence[str]] = None,
     ) -> int:
         """
         Calculate maximum number of markets that can be requested.
 
         Args:
-            market_projection: List of market projections (for catalogue)
-            price_data: List of price projections (for book)
+            market_projection: Market projections (for catalogue)
+            price_data: Price projections (for book)
 
         Returns:
             Maximum number of markets that can be requested
@@ -193,20 +230,10 @@ class MarketDataWeightCalculator:
         # Determine which type of request
         if price_data:
             # Market book request
-            weight_per_market = cls.BASE_WEIGHT_PER_MARKET
-            for projection in price_data:
-                projection_upper = projection.upper()
-                weight_per_market += cls.PRICE_PROJECTION_WEIGHTS.get(
-                    projection_upper, 0
-                )
+            weight_per_market = _book_weight_per_market(_as_tuple(price_data), False, False)
         elif market_projection:
             # Market catalogue request
-            weight_per_market = cls.BASE_WEIGHT_PER_MARKET
-            for projection in market_projection:
-                projection_upper = projection.upper()
-                weight_per_market += cls.MARKET_PROJECTION_WEIGHTS.get(
-                    projection_upper, 0
-                )
+            weight_per_market = _catalogue_weight_per_market(_as_tuple(market_projection))
         else:
             # Minimal request
             weight_per_market = cls.BASE_WEIGHT_PER_MARKET
@@ -217,8 +244,9 @@ class MarketDataWeightCalculator:
         max_markets = cls.MAX_WEIGHT // weight_per_market
 
         logger.debug(
-            f"Maximum markets for this request: {max_markets} "
-            f"(weight per market: {weight_per_market})"
+            "Maximum markets for this request: %d (weight per market: %d)",
+            max_markets,
+            weight_per_market,
         )
 
         return max_markets
@@ -227,8 +255,8 @@ class MarketDataWeightCalculator:
     def split_markets_by_weight(
         cls,
         market_ids: List[str],
-        market_projection: Optional[List[str]] = None,
-        price_data: Optional[List[str]] = None,
+        market_projection: Optional[Sequence[str]] = None,
+        price_data: Optional[Sequence[str]] = None,
     ) -> List[List[str]]:
         """
         Split market IDs into chunks that respect weight limits.
@@ -246,15 +274,78 @@ class MarketDataWeightCalculator:
             price_data=price_data,
         )
 
-        chunks = []
-        for i in range(0, len(market_ids), max_markets):
-            chunk = market_ids[i:i + max_markets]
-            chunks.append(chunk)
+        # Fast path: the whole request fits in one chunk
+        if len(market_ids) <= max_markets:
+            return [market_ids] if market_ids else []
 
-        if len(chunks) > 1:
-            logger.info(
-                f"Split {len(market_ids)} markets into {len(chunks)} chunks "
-                f"to respect weight limits (max {max_markets} markets/chunk)"
-            )
+        chunks = [
+            market_ids[i:i + max_markets] for i in range(0, len(market_ids), max_markets)
+        ]
+
+        logger.info(
+            "Split %d markets into %d chunks to respect weight limits (max %d markets/chunk)",
+            len(market_ids),
+            len(chunks),
+            max_markets,
+        )
 
         return chunks
+
+
+def _as_tuple(projections: Optional[Sequence[str]]) -> Tuple[str, ...]:
+    """Normalise a projection sequence to a hashable cache key."""
+    if projections is None:
+        return ()
+    if type(projections) is tuple:
+        return projections
+    return tuple(projections)
+
+
+@functools.lru_cache(maxsize=64)
+def _catalogue_weight_per_market(projections: Tuple[str, ...]) -> int:
+    """
+    Weight per market for a set of market projections.
+
+    Cached on the raw tuple, so upper-casing and table lookups only run
+    (and unknown projections are only warned about) on the first call.
+    """
+    calc = MarketDataWeightCalculator
+    upper = [projection.upper() for projection in projections]
+
+    for projection, projection_upper in zip(projections, upper):
+        if projection_upper not in calc.MARKET_PROJECTION_KEYS:
+            logger.warning(f"Unknown market projection: {projection}")
+
+    # Base weight plus the weight of each known projection
+    weights = calc.MARKET_PROJECTION_WEIGHTS
+    return calc.BASE_WEIGHT_PER_MARKET + sum(weights.get(p, 0) for p in upper)
+
+
+@functools.lru_cache(maxsize=64)
+def _book_weight_per_market(
+    price_data: Tuple[str, ...], order_projection: bool, match_projection: bool
+) -> int:
+    """
+    Weight per market for a set of price projections.
+
+    Cached on the raw arguments, so upper-casing and table lookups only run
+    (and unknown projections are only warned about) on the first call.
+    """
+    calc = MarketDataWeightCalculator
+    upper = [projection.upper() for projection in price_data]
+
+    for projection, projection_upper in zip(price_data, upper):
+        if projection_upper not in calc.PRICE_PROJECTION_KEYS:
+            logger.warning(f"Unknown price projection: {projection}")
+
+    # Base weight plus the weight of each known price projection
+    weights = calc.PRICE_PROJECTION_WEIGHTS
+    weight_per_market = calc.BASE_WEIGHT_PER_MARKET + sum(weights.get(p, 0) for p in upper)
+
+    # Order and match projections add weight
+    if order_projection:
+        weight_per_market += 2  # Approximate weight for order projection
+    if match_projection:
+        weight_per_market += 2  # Approximate weight for match projection
+
+    return weight_per_market
@@ -0,0 +1,59 @@
+"""Tests for Betfair error classification."""
+
+import pytest
+from betfairlightweight.exceptions import BetfairError
+
+from betfair_mcp.error_handling import (
+    DataLimitError,
+    RateLimitError,
+    SessionExpiredError,
+    ThrottledError,
+    classify_betfair_error,
+)
+
+
+@pytest.mark.parametrize(
+    "message, expected",
+    [
+        ("INVALID_SESSION_TOKEN", SessionExpiredError),
+        ("NO_SESSION", SessionExpiredError),
+        ("TOO_MANY_REQUESTS", RateLimitError),
+        ("TOO_MUCH_DATA", DataLimitError),
+        ("THROTTLED", ThrottledError),
+        ("TEMPORARY_BAN_TOO_MANY_REQUESTS", RateLimitError),
+        # Matching is case-insensitive
+        ("invalid_session_token", SessionExpiredError),
+        ("Too_Many_Requests", RateLimitError),
+        ("error: too_much_data", DataLimitError),
+        ("temporary_ban", ThrottledError),
+        # Several tokens: the earlier check of the original if-chain wins
+        ("INVALID_SESSION_TOKEN after TOO_MANY_REQUESTS", SessionExpiredError),
+        ("TOO_MANY_REQUESTS then session lost", SessionExpiredError),
+        ("THROTTLED: TOO_MUCH_DATA", DataLimitError),
+        ("temporary_ban and too_many_requests", RateLimitError),
+    ],
+)
+def test_classify_priority_and_case(message, expected):
+    classified = classify_betfair_error(BetfairError(message))
+
+    assert type(classified) is expected
+    assert message in str(classified)
+
+
+@pytest.mark.parametrize(
+    "message, prefix",
+    [
+        ("INVALID_SESSION_TOKEN", "Session expired or invalid: "),
+        ("TOO_MANY_REQUESTS", "Rate limit exceeded: "),
+        ("TOO_MUCH_DATA", "Request contains too much data: "),
+        ("THROTTLED", "Temporarily throttled or banned: "),
+    ],
+)
+def test_classified_message_prefix(message, prefix):
+    assert str(classify_betfair_error(BetfairError(message))) == prefix + message
+
+
+def test_unclassified_error_is_returned_unchanged():
+    error = BetfairError("MARKET_NOT_FOUND")
+
+    assert classify_betfair_error(error) is error
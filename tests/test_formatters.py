@@ -0,0 +1,173 @@
+"""Tests for the summary formatters."""
+
+import orjson
+
+from betfair_mcp import formatters
+from betfair_mcp.formatters import (
+    MAX_LIST_ITEMS,
+    MAX_SUMMARY_LENGTH,
+    MAX_TABLE_ROWS,
+    Summary,
+    format_competitions,
+    format_competitions_json,
+    format_events,
+    format_json,
+    format_market_catalogue,
+)
+
+
+def _price_payload(num_markets: int) -> list:
+    """Build a get_market_prices-shaped payload."""
+    ladder = [
+        {"price": 2.02, "size": 150.0},
+        {"price": 2.04, "size": 80.5},
+        {"price": 2.06, "size": 12.0},
+    ]
+    return [
+        {
+            "market_id": f"1.{200000000 + m}",
+            "status": "OPEN",
+            "total_matched": 12345.67,
+            "runners": [
+                {
+                    "selection_id": str(1000 + r),
+                    "status": "ACTIVE",
+                    "last_price_traded": 2.04,
+                    "total_matched": 999.99,
+                    "back_prices": ladder,
+                    "lay_prices": ladder,
+                }
+                for r in range(3)
+            ],
+        }
+        for m in range(num_markets)
+    ]
+
+
+def test_format_json_caps_large_price_payload():
+    summary = format_json(_price_payload(75), MAX_LIST_ITEMS)
+
+    assert len(summary.text) <= MAX_SUMMARY_LENGTH
+    assert summary.truncated
+    # Still valid JSON: whole items are dropped, never cut mid-item
+    assert len(orjson.loads(summary.text)) >= 1
+
+
+def test_format_json_small_payload_not_truncated():
+    data = _price_payload(2)
+    summary = format_json(data, MAX_LIST_ITEMS)
+
+    assert orjson.loads(summary.text) == data
+    assert not summary.truncated
+
+
+def test_format_json_flags_dropped_items():
+    data = [{"id": str(i)} for i in range(MAX_LIST_ITEMS + 5)]
+    summary = format_json(data, MAX_LIST_ITEMS)
+
+    assert len(orjson.loads(summary.text)) == MAX_LIST_ITEMS
+    assert summary.truncated
+
+
+def test_format_competitions_json_matches_markdown_selection():
+    data = [
+        {"competition_id": str(i), "competition_name": f"C{i}", "market_count": (i * 37) % 101}
+        for i in range(MAX_TABLE_ROWS + 30)
+    ]
+    json_ids = [c["competition_id"] for c in orjson.loads(format_competitions_json(data).text)]
+    # Table rows look like "| <id> | <name> | <markets> |"; skip the header
+    rows = format_competitions(data).text.splitlines()[4:]
+    markdown_ids = [row.split(" | ")[0].lstrip("| ") for row in rows if row.startswith("| ")]
+
+    assert json_ids == markdown_ids
+    assert len(json_ids) == MAX_TABLE_ROWS
+
+
+def _counting_formatter(label: str, key_items=None):
+    """Memoized formatter that records how often it actually renders."""
+    calls = []
+
+    @formatters._memoize_summary(key_items=key_items)
+    def render(data):
+        calls.append(data)
+        return Summary(f"{label}: {len(data)}", False)
+
+    return render, calls
+
+
+def test_memoized_summary_hits_on_equal_data():
+    render, calls = _counting_formatter("list")
+
+    first = render([{"id": "1"}, {"id": "2"}])
+    # An equal but distinct list hits the cache
+    second = render([{"id": "1"}, {"id": "2"}])
+
+    assert second is first
+    assert len(calls) == 1
+
+    render([{"id": "1"}, {"id": "3"}])
+    assert len(calls) == 2
+
+
+def test_memoized_summary_keys_on_display_slice_and_length():
+    render, calls = _counting_formatter("list", key_items=2)
+
+    render([{"id": "1"}, {"id": "2"}, {"id": "3"}])
+    # Items past key_items do not change the output, so they do not miss...
+    render([{"id": "1"}, {"id": "2"}, {"id": "9"}])
+    assert len(calls) == 1
+    # ...but the total count does
+    render([{"id": "1"}, {"id": "2"}, {"id": "3"}, {"id": "4"}])
+    assert len(calls) == 2
+
+
+def test_memoized_summary_evicts_least_recently_used(monkeypatch):
+    monkeypatch.setattr(formatters, "SUMMARY_CACHE_SIZE", 2)
+    render, calls = _counting_formatter("list")
+    a, b, c = [{"id": "a"}], [{"id": "b"}], [{"id": "c"}]
+
+    render(a)
+    render(b)
+    render(a)  # a becomes the most recently used
+    render(c)  # evicts b
+    assert len(calls) == 3
+
+    render(a)
+    assert len(calls) == 3
+    render(b)
+    assert len(calls) == 4
+
+
+def test_memoized_summaries_do_not_leak_between_formatters():
+    first, first_calls = _counting_formatter("first")
+    second, second_calls = _counting_formatter("second")
+    data = [{"id": "1"}]
+
+    assert first(data).text == "first: 1"
+    assert second(data).text == "second: 1"
+    assert len(first_calls) == len(second_calls) == 1
+
+
+def test_real_formatters_keep_separate_caches():
+    format_events.cache_clear()
+    format_market_catalogue.cache_clear()
+    # One payload that satisfies both formatters
+    data = [
+        {
+            "event_id": "1",
+            "event_name": "A v B",
+            "market_count": 3,
+            "market_id": "1.1",
+            "market_name": "Match Odds",
+            "market_type": "MATCH_ODDS",
+            "total_matched": 0.0,
+            "runners": [],
+        }
+    ]
+
+    events = format_events(data)
+    catalogue = format_market_catalogue(data)
+
+    assert events.text.startswith("## Events")
+    assert catalogue.text.startswith("## Markets")
+    assert format_events(data) is events
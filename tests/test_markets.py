@@ -0,0 +1,154 @@
+"""Tests for the market price fetch: single-flight, caching and chunking."""
+
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+from betfairlightweight.exceptions import BetfairError
+
+from betfair_mcp.tools import markets
+
+
+class FakeBetting:
+    """Blocking list_market_book stand-in that records its calls."""
+
+    def __init__(self, delay: float = 0.05, fail_on: str = ""):
+        self.delay = delay
+        self.fail_on = fail_on
+        self.calls: list[list[str]] = []
+        self._lock = threading.Lock()
+
+    def list_market_book(self, market_ids, price_projection):
+        with self._lock:
+            self.calls.append(list(market_ids))
+        if self.fail_on in market_ids:
+            raise BetfairError("list_market_book failed")
+        time.sleep(self.delay)
+        return [
+            SimpleNamespace(market_id=mid, status="OPEN", total_matched=None, runners=[])
+            for mid in market_ids
+        ]
+
+
+class FakeRateLimiter:
+    """Admits the first chunk at once and holds later ones for ``hold`` seconds."""
+
+    def __init__(self, hold: float = 0.0):
+        self.hold = hold
+        self.admitted = 0
+        self.cancelled = 0
+
+    async def acquire_markets(self, market_ids):
+        self.admitted += 1
+        if self.admitted == 1 or not self.hold:
+            return
+        try:
+            await asyncio.sleep(self.hold)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+
+
+@pytest.fixture(autouse=True)
+def _clean_price_state(monkeypatch):
+    monkeypatch.setattr(markets, "_rate_limiter", FakeRateLimiter())
+    markets._inflight_prices.clear()
+    markets._recent_prices.clear()
+    yield
+    markets._inflight_prices.clear()
+    markets._recent_prices.clear()
+
+
+def _client(betting: FakeBetting) -> SimpleNamespace:
+    return SimpleNamespace(betting=betting)
+
+
+async def test_concurrent_callers_share_one_fetch():
+    betting = FakeBetting()
+    ids = ["1.1", "1.2"]
+
+    results = await asyncio.gather(
+        *[markets.get_market_prices(_client(betting), ids) for _ in range(3)]
+    )
+
+    assert len(betting.calls) == 1
+    assert [m["market_id"] for m in results[0]] == ids
+    assert results[0] is results[1] is results[2]
+    # A repeat inside PRICE_CACHE_TTL is served from the cache
+    assert await markets.get_market_prices(_client(betting), ids) is results[0]
+    assert len(betting.calls) == 1
+
+
+async def test_different_order_is_a_separate_request():
+    betting = FakeBetting(delay=0)
+
+    forward = await markets.get_market_prices(_client(betting), ["1.1", "1.2"])
+    backward = await markets.get_market_prices(_client(betting), ["1.2", "1.1"])
+
+    assert [m["market_id"] for m in forward] == ["1.1", "1.2"]
+    assert [m["market_id"] for m in backward] == ["1.2", "1.1"]
+    assert len(betting.calls) == 2
+
+
+async def test_cancelled_first_caller_does_not_break_others():
+    betting = FakeBetting()
+    ids = ["1.1"]
+
+    first = asyncio.create_task(markets.get_market_prices(_client(betting), ids))
+    await asyncio.sleep(0)
+    second = asyncio.create_task(markets.get_market_prices(_client(betting), ids))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    result = await second
+
+    assert first.cancelled()
+    assert [m["market_id"] for m in result] == ids
+    assert len(betting.calls) == 1
+    assert not markets._inflight_prices
+
+
+async def test_error_reaches_every_waiter_and_clears_inflight():
+    betting = FakeBetting(fail_on="1.1")
+    ids = ["1.1"]
+
+    results = await asyncio.gather(
+        *[markets.get_market_prices(_client(betting), ids) for _ in range(3)],
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(r, BetfairError) for r in results)
+    assert len(betting.calls) == 1
+    assert not markets._inflight_prices
+    # Failures are not cached: the next call fetches again
+    with pytest.raises(BetfairError):
+        await markets.get_market_prices(_client(betting), ids)
+    assert len(betting.calls) == 2
+
+
+async def test_failed_chunk_cancels_sibling_chunks(monkeypatch):
+    limiter = FakeRateLimiter(hold=1.0)
+    monkeypatch.setattr(markets, "_rate_limiter", limiter)
+    # 70 markets at 6 points each split into chunks of 33, 33 and 4
+    ids = [f"1.{i}" for i in range(70)]
+    betting = FakeBetting(fail_on="1.0")
+
+    start = time.monotonic()
+    with pytest.raises(BetfairError):
+        await markets.get_market_prices(_client(betting), ids)
+
+    assert time.monotonic() - start < 0.5
+    assert limiter.admitted == 3
+    assert limiter.cancelled == 2
+    assert betting.calls == [ids[:33]]
+
+
+async def test_chunked_results_keep_request_order():
+    ids = [f"1.{i}" for i in range(70)]
+
+    result = await markets.get_market_prices(_client(FakeBetting(delay=0)), ids)
+
+    assert [m["market_id"] for m in result] == ids
+
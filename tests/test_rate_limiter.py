@@ -0,0 +1,51 @@
+"""Tests for the token-bucket rate limiter."""
+
+import asyncio
+import time
+
+import pytest
+
+from betfair_mcp.rate_limiter import TokenBucket
+
+
+async def _timed_acquires(bucket: TokenBucket, count: int) -> float:
+    """Acquire ``count`` tokens one after another; return the elapsed seconds."""
+    start = time.monotonic()
+    for _ in range(count):
+        await bucket.acquire()
+    return time.monotonic() - start
+
+
+async def test_burst_up_to_capacity_is_immediate():
+    bucket = TokenBucket(max_rate=10, time_period=1)
+
+    assert await _timed_acquires(bucket, 10) < 0.05
+    assert bucket.tokens < 1
+
+
+async def test_refill_paces_acquires_beyond_the_burst():
+    # 5 tokens per 0.1 s: 5 immediate, then 10 more at 50/s take ~0.2 s
+    bucket = TokenBucket(max_rate=5, time_period=0.1)
+
+    elapsed = await _timed_acquires(bucket, 15)
+
+    assert 0.18 <= elapsed < 0.5
+
+
+async def test_cancelled_acquire_consumes_no_token():
+    # One token per 0.2 s, drained up front
+    bucket = TokenBucket(max_rate=1, time_period=0.2)
+    await bucket.acquire()
+
+    waiter = asyncio.create_task(bucket.acquire())
+    await asyncio.sleep(0.02)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    # The next caller gets the token the cancelled waiter was sleeping for,
+    # so it waits out the remainder of one refill, not two
+    elapsed = await _timed_acquires(bucket, 1)
+
+    assert elapsed < 0.3
+    assert 0 <= bucket.tokens < 1